@@ -1,4 +1,5 @@
 # Import functions for programmatic use
 from .generator import generate_case, generate_report
+from .cli import generate_batch, iter_batch
 
 # Don't import main to avoid circular imports when using python -m
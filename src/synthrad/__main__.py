@@ -5,7 +5,9 @@ Entry point for running synthrad.generator as a module.
 This avoids the circular import issues with __init__.py
 """
 
-from .generator import main
+import sys
+
+from .cli import run
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run())
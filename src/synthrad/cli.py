@@ -0,0 +1,60 @@
+"""
+In-process entry point for the synthrad command line.
+
+Calling run() executes the same code path as `python -m synthrad` without
+spawning a new interpreter, which keeps repeated invocations (tests, batch
+tools) from paying interpreter startup and import costs each time.
+"""
+
+import traceback
+from typing import Iterable, Iterator, List, Optional
+
+from .generator import main, build_parser, make_ontology_generator, _run
+
+
+def _exit_status(e: SystemExit) -> int:
+    # argparse exits on --help and on invalid arguments
+    if e.code is None:
+        return 0
+    return e.code if isinstance(e.code, int) else 1
+
+
+def run(argv: Optional[List[str]] = None) -> int:
+    """Parse argv and run the generator, returning a process exit status."""
+    try:
+        return main(argv)
+    except SystemExit as e:
+        return _exit_status(e)
+
+
+def iter_batch(argvs: Iterable[List[str]]) -> Iterator[int]:
+    """Run the generator once per argv list, yielding each exit status as its run finishes.
+
+    All runs share a single ontology generator, so RadLex is initialized at most
+    once for the whole batch instead of once per run. Each run happens when its
+    status is requested, so callers can capture or time runs individually.
+    """
+    parser = build_parser()
+    ontology_generator = None
+    ontology_tried = False
+    for argv in argvs:
+        try:
+            args = parser.parse_args(argv)
+            if not args.no_radlex and not ontology_tried:
+                ontology_generator = make_ontology_generator()
+                ontology_tried = True
+            yield _run(args, ontology_generator, init_ontology=False)
+        except SystemExit as e:
+            yield _exit_status(e)
+        except Exception:
+            # One bad run shouldn't abort the rest; report it the way the interpreter would
+            traceback.print_exc()
+            yield 1
+
+
+def generate_batch(argvs: Iterable[List[str]]) -> List[int]:
+    """Run the generator once per argv list, returning one exit status per run.
+
+    See iter_batch; RadLex is initialized at most once for the whole batch.
+    """
+    return list(iter_batch(argvs))
@@ -524,7 +524,7 @@ def generate_report(case: Case, modality: str = "CT", include_recist: bool = Tru
         
         # Metastases
         for i, met in enumerate(case.mets):
-            lesion_id = f"{met.site.replace('_', '-')}-longest-{i+1}"
+            lesion_id = f"{met.site_slug}-longest-{i+1}"
             current_lesions[lesion_id] = {
                 "type": "metastasis",
                 "size_mm": met.size_mm,
@@ -659,7 +659,7 @@ def generate_report(case: Case, modality: str = "CT", include_recist: bool = Tru
                 met_text = met_template.format(site=site_name, size=met.size_mm)
                 
                 # Add interval change if available
-                lesion_id = f"{met.site.replace('_', '-')}-longest-{i+1}"
+                lesion_id = f"{met.site_slug}-longest-{i+1}"
                 if lesion_id in lesion_changes:
                     change_data = lesion_changes[lesion_id]
                     if change_data.get("new"):
@@ -1465,13 +1465,14 @@ def case_to_recist_jsonl(cases: List[Case], study_dates: List[datetime.datetime]
         # end per patient
     return jsonl_data
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     ap = argparse.ArgumentParser(description="Generate synthetic lung cancer CT reports with TNM-aware details.")
     ap.add_argument("--n", type=int, default=5, help="Number of patients to generate")
     ap.add_argument("--out", type=str, default="./out", help="Output directory")
     ap.add_argument("--seed", type=int, default=0, help="Random seed (deterministic)")
     ap.add_argument("--lobe", type=str, default=None, choices=[None,"RUL","RML","RLL","LUL","LLL"], help="Force primary lobe (optional)")
-    ap.add_argument("--stage-dist", type=str, default="I:0.25,II:0.25,III:0.30,IV:0.20", help="Stage distribution")
+    ap.add_argument("--stage-dist", type=str, action="append", default=None,
+                    help="Stage distribution; repeat to assign distributions to patients round-robin")
     ap.add_argument("--follow-up", action="store_true", help="Generate follow-up cases for each baseline case")
     ap.add_argument("--follow-up-days", type=int, default=90, help="Days between baseline and follow-up (default: 90)")
     ap.add_argument("--studies-per-patient", type=int, default=5, help="Max studies per patient (2-10, default: 5)")
@@ -1480,31 +1481,49 @@ def main():
     ap.add_argument("--legacy-mode", action="store_true", help="Use legacy flat file structure")
     ap.add_argument("--jsonl", type=str, default=None, help="Output JSONL file for React app (e.g., cohort_labels.jsonl)")
     ap.add_argument("--ontology-only", action="store_true", help="Generate only ontology JSON files (skip traditional .txt and .json files)")
-    args = ap.parse_args()
-
+    return ap
+
+def make_ontology_generator():
+    """Create the RadLex-backed ontology generator, or None if it cannot be initialized."""
+    try:
+        from .ontology_config_generator import OntologyConfigGenerator
+        return OntologyConfigGenerator(use_radlex=True)
+    except Exception as e:
+        print(f"Warning: Failed to initialize ontology generator: {e}")
+        return None
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return _run(args)
+
+def _run(args: argparse.Namespace, ontology_generator=None, init_ontology: bool = True) -> int:
+    """Generate the cohort described by parsed CLI args.
+
+    ontology_generator is reused when given, so batch callers initialize RadLex
+    once; otherwise one is created here if RadLex is enabled. Callers that have
+    already tried (and failed) to create one pass init_ontology=False.
+    """
     if args.studies_per_patient < 2 or args.studies_per_patient > 10:
         print("Error: studies-per-patient must be between 2 and 10")
-        return
+        return 1
 
     rng = random.Random(args.seed)
-    dist = parse_stage_dist(args.stage_dist)
+    dists = [parse_stage_dist(d) for d in (args.stage_dist or ["I:0.25,II:0.25,III:0.30,IV:0.20"])]
     response_dist = parse_response_dist(args.response_dist)
     use_radlex = not args.no_radlex
 
     # Initialize ontology config generator if RadLex is enabled
-    ontology_generator = None
-    if use_radlex:
-        try:
-            from .ontology_config_generator import OntologyConfigGenerator
-            ontology_generator = OntologyConfigGenerator(use_radlex=True)
-        except Exception as e:
-            print(f"Warning: Failed to initialize ontology generator: {e}")
+    if not use_radlex:
+        ontology_generator = None
+    elif ontology_generator is None and init_ontology:
+        ontology_generator = make_ontology_generator()
 
     all_cases = []
     all_study_dates = []
 
     for i in range(args.n):
         patient_id = f"P{i:04d}"
+        dist = dists[i % len(dists)]
 
         if args.legacy_mode:
             baseline_case = generate_case(
@@ -1574,5 +1593,7 @@ def main():
         except Exception as e:
             print(f"Warning: Failed to auto-generate ontology-based JSONL: {e}")
 
+    return 0
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
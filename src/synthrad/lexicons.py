@@ -316,7 +316,7 @@ def select_recist_targets(primary, nodes, mets):
                 "organ": met.site,
                 "size_mm": met.size_mm,
                 "measurement_type": "longest",
-                "lesion_id": f"{met.site.replace('_', '-')}-longest-{i+1}"
+                "lesion_id": f"{met.site_slug}-longest-{i+1}"
             })
             organ_counts[met.site] = organ_counts.get(met.site, 0) + 1
     
@@ -358,7 +358,7 @@ def classify_nontarget_lesions(primary, nodes, mets, targets):
     
     # Metastases (if not selected as targets)
     for i, met in enumerate(mets):
-        met_id = f"{met.site.replace('_', '-')}-longest-{i+1}"
+        met_id = f"{met.site_slug}-longest-{i+1}"
         if met_id not in target_ids:
             nontargets.append({
                 "type": "metastasis",
@@ -1,5 +1,5 @@
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class Meta(BaseModel):
     modality: Literal["CT chest with IV contrast"] = "CT chest with IV contrast"
@@ -10,18 +10,30 @@ class Meta(BaseModel):
     radiologist_style: Optional[str] = None  # Different writing styles
 
 class Primary(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     lobe: str
     size_mm: int
     features: List[str] = []  # e.g., spiculation, cavitation, pleural_inv_suspected, chest_wall_invasion, atelectasis
 
 class Node(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     station: str  # e.g., 4R, 2L, 7, 10R
     short_axis_mm: int
 
 class Met(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     site: str  # e.g., adrenal_right, liver, brain, bone
     size_mm: int
 
+    @property
+    def site_slug(self) -> str:
+        # lesion-ID form of the site (adrenal_right -> adrenal-right), shared by every lesion-ID builder;
+        # computed on access so it always follows site, including after model_copy(update=...)
+        return self.site.replace("_", "-")
+
 class TNM(BaseModel):
     T: str
     N: str
@@ -0,0 +1,87 @@
+import copy
+from functools import lru_cache
+
+import pytest
+
+from synthrad.generator import generate_case, generate_report
+from synthrad.lexicons import select_recist_targets
+from synthrad.schema import Node, Met
+
+
+@pytest.fixture
+def out_dir(tmp_path_factory):
+    """Scratch directory for generated output; pytest prunes old base temp dirs itself"""
+    return tmp_path_factory.mktemp("synthrad_test")
+
+
+# Session-scoped cases are generated once and shared read-only; tests that
+# modify a case take the function-scoped deep copy instead.
+
+@pytest.fixture(scope="session")
+def base_case_42():
+    """Seed-42 case shared by every test in the session (do not modify)"""
+    return generate_case(seed=42, patient_id="SHARED")
+
+
+@pytest.fixture(scope="session")
+def recist_targets_42(base_case_42):
+    """RECIST target lesions selected from the shared seed-42 case"""
+    return select_recist_targets(base_case_42.primary, base_case_42.nodes, base_case_42.mets)
+
+
+@pytest.fixture(scope="session")
+def base_case_123():
+    """Seed-123 baseline visit shared by every test in the session (do not modify)"""
+    return generate_case(seed=123, patient_id="P005", visit_number=1)
+
+
+@pytest.fixture(scope="session")
+def base_case_999():
+    """Seed-999 case shared by every test in the session (do not modify)"""
+    return generate_case(seed=999, patient_id="TEST006")
+
+
+@pytest.fixture
+def case_999(base_case_999):
+    """Private copy of the seed-999 case, free to be modified"""
+    return copy.deepcopy(base_case_999)
+
+
+def _ensure_all_lesion_types(case):
+    if not case.nodes:
+        case.nodes = [Node(station="4R", short_axis_mm=12)]
+    if not case.mets:
+        case.mets = [Met(site="liver", size_mm=20)]
+
+
+def _remove_nodes(case):
+    case.nodes = []
+
+
+def _remove_all_lesions(case):
+    case.primary = None
+    case.nodes = []
+    case.mets = []
+
+
+# Mutation applied to a freshly generated case before reporting, by tag
+CASE_MUTATIONS = {
+    "base": lambda case: None,
+    "all_lesion_types": _ensure_all_lesion_types,
+    "no_nodes": _remove_nodes,
+    "no_lesions": _remove_all_lesions,
+}
+
+
+@lru_cache(maxsize=None)
+def _report(seed, style, tag="base"):
+    case = generate_case(seed=seed)
+    CASE_MUTATIONS[tag](case)
+    case.meta.radiologist_style = style
+    return generate_report(case)
+
+
+@pytest.fixture(scope="session")
+def cached_report():
+    """Report lookup by (seed, style, mutation tag); each combination is generated once per session"""
+    return _report
@@ -6,9 +6,6 @@ import sys
 import pytest
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 def run_all_tests():
     """Run all tests in the tests directory"""
     test_dir = Path(__file__).parent
@@ -21,7 +18,10 @@ def run_all_tests():
         "test_longitudinal.py",
         "test_styles.py",
         "test_edge_cases.py",
-        "test_integration.py"
+        "test_integration.py",
+        "test_cli.py",
+        "test_radlex_service.py",
+        "test_tools.py"
     ]
     
     # Run tests
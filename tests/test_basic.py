@@ -1,9 +1,3 @@
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from synthrad.generator import generate_case, generate_report
 
 def test_basic():
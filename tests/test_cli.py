@@ -0,0 +1,150 @@
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from synthrad.cli import run, generate_batch
+
+
+_MET_RE = re.compile(r"^- Distant metastatic disease involving .*$", re.MULTILINE)
+_LN_RE = re.compile(r"^(?=.*\bnode\b)(?=.*\bmm\b).*$", re.MULTILINE | re.IGNORECASE)
+_SITE_RE = re.compile(r"(?:involving |, )([a-z ]+) \(\d+ mm\)", re.IGNORECASE)
+
+STAGE_DISTRIBUTIONS = [
+    ("default", "I:0.25,II:0.25,III:0.30,IV:0.20", None),
+    ("early_stage", "I:0.6,II:0.3,III:0.1,IV:0.0", None),
+    ("advanced_stage", "I:0.0,II:0.1,III:0.4,IV:0.5", None),
+    ("stage_iii_only", "I:0,II:0,III:1,IV:0", None),
+    ("stage_iv_only", "I:0,II:0,III:0,IV:1", "IV"),
+]
+
+
+class TestCLI:
+    """Test the synthrad command line, invoked in-process"""
+
+    def test_basic_functionality(self, out_dir):
+        """Test that a basic run writes report and case files"""
+        assert run(["--n", "2", "--out", str(out_dir), "--seed", "42"]) == 0
+
+        txt_files = list(out_dir.rglob("*.txt"))
+        json_files = list(out_dir.rglob("*.json"))
+        assert len(txt_files) > 0
+        assert len(json_files) >= len(txt_files)
+
+        for txt_file in txt_files:
+            content = txt_file.read_text(encoding="utf-8")
+            assert "FINDINGS:" in content
+            assert "IMPRESSION:" in content
+
+    def test_followup_functionality(self, out_dir):
+        """Test that legacy follow-up mode writes a second study per patient"""
+        assert run(["--n", "3", "--out", str(out_dir), "--seed", "42",
+                    "--legacy-mode", "--follow-up", "--no-radlex"]) == 0
+
+        patient_dirs = [p for p in out_dir.iterdir() if p.is_dir()]
+        assert len(patient_dirs) == 3
+        for patient_dir in patient_dirs:
+            assert (patient_dir / "study_01").is_dir()
+            assert (patient_dir / "study_02").is_dir()
+
+    def test_jsonl_output(self, out_dir):
+        """Test that --jsonl writes one record per generated study"""
+        assert run(["--n", "3", "--out", str(out_dir), "--seed", "42",
+                    "--jsonl", "cohort_labels.jsonl"]) == 0
+
+        jsonl_file = out_dir / "cohort_labels.jsonl"
+        assert jsonl_file.exists()
+
+        n_records = 0
+        with jsonl_file.open("rb") as f:
+            for line in f:
+                entry = json.loads(line)
+                assert "patient_id" in entry
+                assert "lesions" in entry
+                n_records += 1
+        assert n_records == len(list(out_dir.rglob("*.txt")))
+
+    def test_duplicate_findings(self, out_dir):
+        """Test that baseline reports do not describe the same finding twice"""
+        assert run(["--n", "5", "--out", str(out_dir), "--seed", "7",
+                    "--legacy-mode", "--no-radlex"]) == 0
+
+        txt_files = sorted(out_dir.rglob("*.txt"))
+        assert len(txt_files) == 5
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            contents = list(ex.map(lambda p: p.read_text(encoding="utf-8"), txt_files))
+
+        for txt_file, content in zip(txt_files, contents):
+            # Single pass over the matches; each set holds only what has been seen so far
+            seen_summaries, seen_sites = set(), set()
+            for met_match in _MET_RE.finditer(content):
+                summary = met_match.group()
+                assert summary not in seen_summaries, f"Duplicate metastatic summary in {txt_file.name}"
+                seen_summaries.add(summary)
+                for site_match in _SITE_RE.finditer(summary):
+                    site = site_match.group(1).lower()
+                    assert site not in seen_sites, f"Duplicate metastatic site {site!r} in {txt_file.name}"
+                    seen_sites.add(site)
+
+            seen_nodes = set()
+            for node_match in _LN_RE.finditer(content):
+                node_line = node_match.group()
+                assert node_line not in seen_nodes, f"Duplicate nodal finding {node_line.strip()!r} in {txt_file.name}"
+                seen_nodes.add(node_line)
+
+    def test_stage_distribution_pipeline(self, out_dir):
+        """Test every stage distribution in one run, assigned to patients round-robin"""
+        argv = ["--n", str(2 * len(STAGE_DISTRIBUTIONS)), "--out", str(out_dir), "--seed", "42",
+                "--jsonl", "stage_dists.jsonl"]
+        for _, dist_config, _ in STAGE_DISTRIBUTIONS:
+            argv += ["--stage-dist", dist_config]
+        assert run(argv) == 0
+
+        assert (out_dir / "stage_dists.jsonl").exists()
+
+        json_files = [p for p in out_dir.rglob("*.json") if not p.name.endswith("_ontology.json")]
+        patients = set()
+        for json_file in json_files:
+            data = json.loads(json_file.read_text(encoding="utf-8"))
+            assert data["clinical_data"]["tnm"]["stage_group"]
+            patient_id = data["meta"]["patient_id"]
+            patients.add(patient_id)
+            dist_name, _, baseline_stage = STAGE_DISTRIBUTIONS[int(patient_id[1:]) % len(STAGE_DISTRIBUTIONS)]
+            if baseline_stage and data["meta"]["visit_number"] == 1:
+                assert data["clinical_data"]["tnm"]["stage_group"] == baseline_stage, dist_name
+        assert len(patients) == 2 * len(STAGE_DISTRIBUTIONS)
+
+    def test_invalid_studies_per_patient(self, out_dir):
+        """Test that an out-of-range --studies-per-patient returns a failure status"""
+        assert run(["--n", "1", "--out", str(out_dir), "--studies-per-patient", "1"]) == 1
+
+    def test_invalid_argument(self, out_dir):
+        """Test that argparse errors are reported as a status instead of exiting"""
+        assert run(["--n", "not-a-number", "--out", str(out_dir)]) == 2
+
+    def test_generate_batch(self, out_dir):
+        """Test that a batch runs every argv in-process and reports one status per run"""
+        statuses = generate_batch([
+            ["--n", "1", "--out", str(out_dir / "a"), "--seed", "1"],
+            ["--n", "1", "--out", str(out_dir / "b"), "--seed", "2", "--no-radlex"],
+            ["--n", "1", "--out", str(out_dir / "c"), "--studies-per-patient", "1"],
+            ["--n", "not-a-number"],
+            ["--n", "1", "--out", str(out_dir / "d"), "--stage-dist", "I:0,II:0,III:0,IV:0"],
+        ])
+        assert statuses == [0, 0, 1, 2, 1]
+        assert list((out_dir / "a").rglob("*.txt"))
+        assert list((out_dir / "b").rglob("*.txt"))
+
+    def test_generate_batch_failed_ontology_init_not_retried(self, out_dir, monkeypatch):
+        """Test that a failed RadLex initialization is attempted once per batch, not once per run"""
+        import synthrad.cli
+        import synthrad.generator
+        calls = []
+        monkeypatch.setattr(synthrad.cli, "make_ontology_generator", lambda: calls.append(1))
+        monkeypatch.setattr(synthrad.generator, "make_ontology_generator", lambda: calls.append(1))
+        statuses = generate_batch([
+            ["--n", "1", "--out", str(out_dir / "a"), "--seed", "1"],
+            ["--n", "1", "--out", str(out_dir / "b"), "--seed", "2"],
+        ])
+        assert statuses == [0, 0]
+        assert len(calls) == 1
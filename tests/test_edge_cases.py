@@ -1,11 +1,7 @@
-import sys
-from pathlib import Path
 import pytest
 import random
 from unittest.mock import patch
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from pydantic import ValidationError
 
 from synthrad.generator import (
     t_category, n_category, m_category, stage_group,
@@ -451,11 +447,25 @@ class TestEdgeCases:
         # Test with case having 0 size lesions
         case = generate_case(seed=42)
         if case.primary:
-            case.primary.size_mm = 0
+            case.primary = case.primary.model_copy(update={"size_mm": 0})
         result = case_to_recist_jsonl([case])
         assert len(result) == 1
         assert len(result[0]["lesions"]) > 0
 
+    def test_lesion_models_are_immutable(self):
+        """Test that lesions are frozen so cases can share them without aliasing bugs"""
+        primary = Primary(lobe="RUL", size_mm=25)
+        node = Node(station="4R", short_axis_mm=12)
+        met = Met(site="adrenal_right", size_mm=15)
+
+        with pytest.raises(ValidationError):
+            primary.size_mm = 30
+        with pytest.raises(ValidationError):
+            node.short_axis_mm = 20
+        with pytest.raises(ValidationError):
+            met.size_mm = 5
 
-if __name__ == "__main__":
-    pytest.main([__file__])
+        # Updates go through model_copy and leave the original untouched
+        grown = primary.model_copy(update={"size_mm": 30})
+        assert grown.size_mm == 30
+        assert primary.size_mm == 25
@@ -1,12 +1,7 @@
-import sys
-from pathlib import Path
 import pytest
 import random
 from unittest.mock import patch
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from synthrad.generator import (
     t_category, n_category, m_category, stage_group,
     sample_primary, sample_nodes, sample_mets, stage_hint_from_dist,
@@ -368,9 +363,20 @@ class TestLongitudinalFeatures:
         
         # Metastasis IDs
         for i, met in enumerate(case.mets):
-            expected_id = f"{met.site.replace('_', '-')}-longest-{i+1}"
+            expected_id = f"{met.site_slug}-longest-{i+1}"
             assert met.site in ["adrenal_right", "adrenal_left", "liver", "bone", "brain", "contralateral_lung", "pleura", "peritoneum", "omentum", "retroperitoneal_nodes"]
 
+    def test_met_site_slug_follows_site(self):
+        """Test that reading site_slug doesn't affect equality, hashing or model_copy updates"""
+        met = Met(site="adrenal_right", size_mm=20)
+        twin = Met(site="adrenal_right", size_mm=20)
+        hash_before = hash(met)
+
+        assert met.site_slug == "adrenal-right"
+        assert met == twin
+        assert hash(met) == hash_before == hash(twin)
+        assert met.model_copy(update={"site": "liver"}).site_slug == "liver"
+
 
 class TestResponseStatus:
     """Test response status determination"""
@@ -383,7 +389,9 @@ class TestResponseStatus:
         # Create follow-up with smaller primary (PR)
         follow_up = generate_case(seed=43)
         if baseline.primary and follow_up.primary:
-            follow_up.primary.size_mm = int(baseline.primary.size_mm * 0.5)  # 50% reduction
+            follow_up.primary = follow_up.primary.model_copy(
+                update={"size_mm": int(baseline.primary.size_mm * 0.5)}  # 50% reduction
+            )
         
         response = determine_response_status(baseline, follow_up)
         assert "Progressive disease" in response or "Partial response" in response or "Stable disease" in response or "Baseline" in response
@@ -438,7 +446,3 @@ class TestRECISTExport:
             assert "kind" in lesion
             assert "size_mm_current" in lesion
             assert "target" in lesion
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
@@ -1,14 +1,8 @@
-import sys
-from pathlib import Path
 import pytest
 import random
 import json
-import tempfile
 import os
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from synthrad.generator import (
     generate_case, generate_report, generate_patient_timeline,
     write_case, case_to_recist_jsonl
@@ -155,7 +149,7 @@ class TestIntegration:
             }
         
         for i, met in enumerate(baseline_case.mets):
-            lesion_id = f"{met.site.replace('_', '-')}-longest-{i+1}"
+            lesion_id = f"{met.site_slug}-longest-{i+1}"
             prior_findings[lesion_id] = {
                 "type": "metastasis",
                 "size_mm": met.size_mm,
@@ -167,8 +161,9 @@ class TestIntegration:
         
         # Manually modify for specific changes
         if baseline_case.primary:
-            follow_up_case.primary = baseline_case.primary
-            follow_up_case.primary.size_mm = baseline_case.primary.size_mm + 2  # Small change
+            follow_up_case.primary = baseline_case.primary.model_copy(
+                update={"size_mm": baseline_case.primary.size_mm + 2}  # Small change
+            )
         
         follow_up_case.nodes = baseline_case.nodes.copy()
         follow_up_case.mets = baseline_case.mets.copy()
@@ -190,51 +185,52 @@ class TestIntegration:
         if baseline_case.primary:
             assert "baseline measurement" in follow_up_report or "stable" in follow_up_report or "increased" in follow_up_report or "decreased" in follow_up_report
     
-    def test_file_output_integration(self):
+    def test_file_output_integration(self, out_dir):
         """Test file output functionality"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Generate a case
-            case = generate_case(seed=42, patient_id="FILE001")
-            
-            # Write case to files
-            write_case(case, temp_dir, "test_case")
-            
-            # Verify files were created
-            patient_dir = os.path.join(temp_dir, case.meta.patient_id)
-            study_dir = os.path.join(patient_dir, f"study_{case.meta.visit_number:02d}")
-            
-            assert os.path.exists(patient_dir)
-            assert os.path.exists(study_dir)
-            
-            # Verify TXT file
-            txt_file = os.path.join(study_dir, f"{case.meta.accession_number}.txt")
-            assert os.path.exists(txt_file)
-            
-            with open(txt_file, 'r') as f:
-                content = f.read()
-                assert "TECHNIQUE:" in content
-                assert "FINDINGS:" in content
-                assert "IMPRESSION:" in content
+        temp_dir = str(out_dir)
+
+        # Generate a case
+        case = generate_case(seed=42, patient_id="FILE001")
+        
+        # Write case to files
+        write_case(case, temp_dir, "test_case")
+        
+        # Verify files were created
+        patient_dir = os.path.join(temp_dir, case.meta.patient_id)
+        study_dir = os.path.join(patient_dir, f"study_{case.meta.visit_number:02d}")
+        
+        assert os.path.exists(patient_dir)
+        assert os.path.exists(study_dir)
+        
+        # Verify TXT file
+        txt_file = os.path.join(study_dir, f"{case.meta.accession_number}.txt")
+        assert os.path.exists(txt_file)
+        
+        with open(txt_file, 'r') as f:
+            content = f.read()
+            assert "TECHNIQUE:" in content
+            assert "FINDINGS:" in content
+            assert "IMPRESSION:" in content
+        
+        # Verify JSON file
+        json_file = os.path.join(study_dir, f"{case.meta.accession_number}.json")
+        assert os.path.exists(json_file)
+        
+        with open(json_file, 'r') as f:
+            data = json.load(f)
+            assert "meta" in data
+            assert "clinical_data" in data
+            assert "anatomic_mapping" in data
             
-            # Verify JSON file
-            json_file = os.path.join(study_dir, f"{case.meta.accession_number}.json")
-            assert os.path.exists(json_file)
+            # Verify meta data
+            assert data["meta"]["patient_id"] == "FILE001"
+            assert data["meta"]["visit_number"] == 1
             
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-                assert "meta" in data
-                assert "clinical_data" in data
-                assert "anatomic_mapping" in data
-                
-                # Verify meta data
-                assert data["meta"]["patient_id"] == "FILE001"
-                assert data["meta"]["visit_number"] == 1
-                
-                # Verify clinical data
-                assert "primary" in data["clinical_data"]
-                assert "nodes" in data["clinical_data"]
-                assert "mets" in data["clinical_data"]
-                assert "tnm" in data["clinical_data"]
+            # Verify clinical data
+            assert "primary" in data["clinical_data"]
+            assert "nodes" in data["clinical_data"]
+            assert "mets" in data["clinical_data"]
+            assert "tnm" in data["clinical_data"]
     
     def test_recist_jsonl_export_integration(self):
         """Test RECIST JSONL export functionality"""
@@ -380,11 +376,11 @@ class TestIntegration:
         case = generate_case(seed=42, patient_id="ERROR001")
         
         # Manually corrupt some data
-        case.primary.size_mm = -5  # Invalid size
+        case.primary = case.primary.model_copy(update={"size_mm": -5})  # Invalid size
         if case.nodes:
-            case.nodes[0].short_axis_mm = -10  # Invalid node size
+            case.nodes[0] = case.nodes[0].model_copy(update={"short_axis_mm": -10})  # Invalid node size
         if case.mets:
-            case.mets[0].size_mm = -15  # Invalid met size
+            case.mets[0] = case.mets[0].model_copy(update={"size_mm": -15})  # Invalid met size
         
         # Should still generate valid report
         report = generate_report(case)
@@ -407,7 +403,3 @@ class TestIntegration:
         assert "FINDINGS:" in report
         assert "IMPRESSION:" in report
         assert "Clear lungs" in report
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
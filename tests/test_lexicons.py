@@ -1,10 +1,5 @@
-import sys
-from pathlib import Path
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from synthrad.lexicons import (
     LOBES, SIDE_FROM_LOBE, NODE_STATIONS, STATION_METADATA, MET_SITES,
     RADIOLOGIST_STYLES, FEATURE_CANON, feature_text, station_label,
@@ -306,7 +301,3 @@ class TestLexiconsFunctions:
         rng1 = make_rng(123)
         rng2 = make_rng(123)
         assert rng1.randint(1, 100) == rng2.randint(1, 100)
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
@@ -1,15 +1,163 @@
-import sys
-from pathlib import Path
 import pytest
 import random
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import re
 
 from synthrad.generator import generate_case, generate_report
 from synthrad.schema import Node, Met
 
 
+def primary_id(primary):
+    return f"lung-{primary.lobe}-longest-1"
+
+
+def node_id(node, i):
+    return f"ln-{node.station}-shortaxis-{i+1}"
+
+
+def met_id(met, i):
+    return f"{met.site_slug}-longest-{i+1}"
+
+
+def prior_primary(baseline_case):
+    """Prior findings covering only the primary tumor"""
+    return {
+        primary_id(baseline_case.primary): {
+            "type": "primary",
+            "size_mm": baseline_case.primary.size_mm,
+            "site": baseline_case.primary.lobe
+        }
+    }
+
+
+def prior_all(baseline_case):
+    """Prior findings covering primary, nodes and metastases"""
+    prior_findings = prior_primary(baseline_case)
+    for i, node in enumerate(baseline_case.nodes):
+        prior_findings[node_id(node, i)] = {
+            "type": "node",
+            "size_mm": node.short_axis_mm,
+            "site": node.station
+        }
+    for i, met in enumerate(baseline_case.mets):
+        prior_findings[met_id(met, i)] = {
+            "type": "metastasis",
+            "size_mm": met.size_mm,
+            "site": met.site
+        }
+    return prior_findings
+
+
+# Scenario builders take the shared baseline and a fresh follow-up case and
+# return (case to report on, prior_findings). They must not mutate the baseline.
+
+def scenario_stable_ids(baseline_case, follow_up_case):
+    """Same lesions at follow-up, primary slightly larger"""
+    follow_up_case.primary = baseline_case.primary.model_copy(
+        update={"size_mm": baseline_case.primary.size_mm + 2}  # Small change
+    )
+    follow_up_case.nodes = list(baseline_case.nodes)
+    follow_up_case.mets = list(baseline_case.mets)
+    return follow_up_case, prior_all(baseline_case)
+
+
+def scenario_increased_primary(baseline_case, follow_up_case):
+    """Primary grows; change should be woven into the narrative"""
+    follow_up_case.primary = baseline_case.primary.model_copy(
+        update={"size_mm": baseline_case.primary.size_mm + 5}  # Increased
+    )
+    return follow_up_case, prior_primary(baseline_case)
+
+
+def scenario_resolved_primary(baseline_case, follow_up_case):
+    """Primary present at baseline, gone at follow-up"""
+    follow_up_case.primary = None  # Resolved
+    return follow_up_case, prior_primary(baseline_case)
+
+
+def scenario_empty_prior(baseline_case, follow_up_case):
+    """Empty prior findings: every lesion is reported as a baseline measurement"""
+    return follow_up_case, {}
+
+
+def scenario_multiple_lesion_types(baseline_case, follow_up_case):
+    """Changes across primary, nodes and metastases"""
+    prior_findings = prior_primary(baseline_case)
+    follow_up_case.primary = baseline_case.primary.model_copy(
+        update={"size_mm": baseline_case.primary.size_mm + 3}  # Stable
+    )
+
+    # One pass per lesion list writes both the prior entry and the follow-up lesion
+    follow_up_case.nodes = []
+    for i, node in enumerate(baseline_case.nodes):
+        prior_findings[node_id(node, i)] = {
+            "type": "node",
+            "size_mm": node.short_axis_mm,
+            "site": node.station
+        }
+        follow_up_case.nodes.append(Node(station=node.station, short_axis_mm=node.short_axis_mm + 2))
+
+    follow_up_case.mets = []
+    for i, met in enumerate(baseline_case.mets):
+        prior_findings[met_id(met, i)] = {
+            "type": "metastasis",
+            "size_mm": met.size_mm,
+            "site": met.site
+        }
+        follow_up_case.mets.append(Met(site=met.site, size_mm=met.size_mm - 1))
+
+    return follow_up_case, prior_findings
+
+
+def scenario_no_prior_parameter(baseline_case, follow_up_case):
+    """prior_findings=None behaves like no comparison"""
+    return follow_up_case, None
+
+
+REPORT_KEYWORDS = frozenset({
+    "stable", "increased", "decreased", "resolved", "new",
+    "baseline measurement", "Clear lungs", "was",
+})
+
+
+def _keyword_pattern(vocab):
+    # longest terms first so "baseline measurement" wins over any shorter overlapping term
+    return re.compile("|".join(re.escape(term) for term in sorted(vocab, key=len, reverse=True)))
+
+
+_KEYWORD_RE = _keyword_pattern(REPORT_KEYWORDS)
+
+
+def extract_keywords(report, vocab=REPORT_KEYWORDS):
+    """Return the set of vocab terms found in report, in a single regex pass"""
+    pattern = _KEYWORD_RE if vocab is REPORT_KEYWORDS else _keyword_pattern(vocab)
+    return set(pattern.findall(report))
+
+
+INTERVAL_CHANGE = frozenset({"stable", "increased", "decreased"})
+
+LONGITUDINAL_SCENARIOS = [
+    # (scenario builder, keyword groups; at least one keyword per group must appear in the report)
+    pytest.param(scenario_stable_ids, [INTERVAL_CHANGE], id="lesion_id_stability"),
+    pytest.param(scenario_increased_primary, [INTERVAL_CHANGE, {"baseline measurement", "was"}], id="comparison_in_narrative"),
+    pytest.param(scenario_resolved_primary, [{"resolved", "Clear lungs"}], id="resolved_lesions"),
+    pytest.param(scenario_empty_prior, [{"baseline measurement"}], id="new_lesions_empty_prior"),
+    pytest.param(scenario_multiple_lesion_types, [INTERVAL_CHANGE | {"baseline measurement"}], id="multiple_lesion_types"),
+    pytest.param(scenario_no_prior_parameter, [{"baseline measurement"}], id="no_prior_findings_parameter"),
+]
+
+
+@pytest.fixture(scope="module")
+def longitudinal_baseline():
+    """Seed-42 LONG001 baseline shared by every longitudinal scenario (lesions are frozen)"""
+    return generate_case(seed=42, patient_id="LONG001", visit_number=1)
+
+
+@pytest.fixture
+def follow_up_case_43():
+    """Fresh follow-up case per scenario, free to be modified"""
+    return generate_case(seed=43, patient_id="LONG001", visit_number=2)
+
+
 class TestLongitudinalConsistency:
     """Test longitudinal consistency features and lesion ID generation"""
     
@@ -34,62 +182,9 @@ class TestLongitudinalConsistency:
         
         # Test metastasis ID format
         for i, met in enumerate(case.mets):
-            expected_met_id = f"{met.site.replace('_', '-')}-longest-{i+1}"
+            expected_met_id = f"{met.site_slug}-longest-{i+1}"
             assert expected_met_id.endswith(f"-longest-{i+1}")
-            assert met.site.replace('_', '-') in expected_met_id
-    
-    def test_lesion_id_stability_across_timepoints(self):
-        """Test that lesion IDs remain stable across timepoints"""
-        # Generate baseline case
-        baseline_case = generate_case(seed=42, patient_id="STABLE001", visit_number=1)
-        
-        # Create prior findings with deterministic IDs
-        prior_findings = {}
-        
-        # Primary tumor
-        if baseline_case.primary:
-            lesion_id = f"lung-{baseline_case.primary.lobe}-longest-1"
-            prior_findings[lesion_id] = {
-                "type": "primary",
-                "size_mm": baseline_case.primary.size_mm,
-                "site": baseline_case.primary.lobe
-            }
-        
-        # Lymph nodes
-        for i, node in enumerate(baseline_case.nodes):
-            lesion_id = f"ln-{node.station}-shortaxis-{i+1}"
-            prior_findings[lesion_id] = {
-                "type": "node",
-                "size_mm": node.short_axis_mm,
-                "site": node.station
-            }
-        
-        # Metastases
-        for i, met in enumerate(baseline_case.mets):
-            lesion_id = f"{met.site.replace('_', '-')}-longest-{i+1}"
-            prior_findings[lesion_id] = {
-                "type": "metastasis",
-                "size_mm": met.size_mm,
-                "site": met.site
-            }
-        
-        # Generate follow-up case with same lesions (different seed for variation)
-        follow_up_case = generate_case(seed=43, patient_id="STABLE001", visit_number=2)
-        
-        # Manually set same lesions to test ID stability
-        if baseline_case.primary:
-            follow_up_case.primary = baseline_case.primary
-            follow_up_case.primary.size_mm += 2  # Small change
-        
-        follow_up_case.nodes = baseline_case.nodes.copy()
-        follow_up_case.mets = baseline_case.mets.copy()
-        
-        # Generate report with prior findings
-        report = generate_report(follow_up_case, prior_findings=prior_findings)
-        
-        # Check that change information is included
-        if baseline_case.primary:
-            assert "stable" in report or "increased" in report or "decreased" in report
+            assert met.site_slug in expected_met_id
     
     def test_change_calculation_logic(self):
         """Test change calculation logic for different scenarios"""
@@ -123,146 +218,23 @@ class TestLongitudinalConsistency:
             
             assert change_desc == expected_change, f"Failed for {current_size} vs {prior_size}: got {change_desc}, expected {expected_change}"
     
-    def test_longitudinal_comparison_integration(self):
-        """Test that longitudinal comparison is integrated into narrative"""
-        # Generate baseline case
-        baseline_case = generate_case(seed=42, patient_id="NARRATIVE001", visit_number=1)
-        
-        # Create prior findings
-        prior_findings = {}
-        if baseline_case.primary:
-            lesion_id = f"lung-{baseline_case.primary.lobe}-longest-1"
-            prior_findings[lesion_id] = {
-                "type": "primary",
-                "size_mm": baseline_case.primary.size_mm,
-                "site": baseline_case.primary.lobe
-            }
-        
-        # Generate follow-up case with changes
-        follow_up_case = generate_case(seed=43, patient_id="NARRATIVE001", visit_number=2)
-        
-        # Manually modify for specific changes
-        if baseline_case.primary:
-            follow_up_case.primary = baseline_case.primary
-            follow_up_case.primary.size_mm = baseline_case.primary.size_mm + 5  # Increased
-        
-        # Generate report
-        report = generate_report(follow_up_case, prior_findings=prior_findings)
-        
-        # Check that change information is in the narrative (not separate section)
-        assert "LONGITUDINAL COMPARISON:" not in report  # Should not have separate section
-        
-        # Check that change information is integrated into findings
-        if baseline_case.primary:
-            assert "increased" in report or "stable" in report or "decreased" in report
-            assert "baseline measurement" in report or "was" in report
-    
-    def test_resolved_lesions_handling(self):
-        """Test handling of resolved lesions"""
-        # Generate baseline case with lesions
-        baseline_case = generate_case(seed=42, patient_id="RESOLVED001", visit_number=1)
-        
-        # Create prior findings
-        prior_findings = {}
-        if baseline_case.primary:
-            lesion_id = f"lung-{baseline_case.primary.lobe}-longest-1"
-            prior_findings[lesion_id] = {
-                "type": "primary",
-                "size_mm": baseline_case.primary.size_mm,
-                "site": baseline_case.primary.lobe
-            }
-        
-        # Generate follow-up case without primary (resolved)
-        follow_up_case = generate_case(seed=43, patient_id="RESOLVED001", visit_number=2)
-        follow_up_case.primary = None  # Resolved
-        
-        # Generate report
-        report = generate_report(follow_up_case, prior_findings=prior_findings)
-        
-        # Check that resolved lesion is mentioned
-        if baseline_case.primary:
-            assert "resolved" in report or "Clear lungs" in report
-    
-    def test_new_lesions_handling(self):
-        """Test handling of new lesions"""
-        # Generate baseline case
-        baseline_case = generate_case(seed=42, patient_id="NEW001", visit_number=1)
-        
-        # Create prior findings (empty for this test)
-        prior_findings = {}
-        
-        # Generate follow-up case with new lesions
-        follow_up_case = generate_case(seed=43, patient_id="NEW001", visit_number=2)
-        
-        # Generate report
-        report = generate_report(follow_up_case, prior_findings=prior_findings)
-        
-        # Check that new lesions are marked as baseline
-        if follow_up_case.primary:
-            assert "baseline measurement" in report
-    
-    def test_multiple_lesion_types_changes(self):
-        """Test changes across multiple lesion types (primary, nodes, mets)"""
-        # Generate baseline case
-        baseline_case = generate_case(seed=42, patient_id="MULTI001", visit_number=1)
-        
-        # Create prior findings for all lesion types
-        prior_findings = {}
-        
-        # Primary tumor
-        if baseline_case.primary:
-            lesion_id = f"lung-{baseline_case.primary.lobe}-longest-1"
-            prior_findings[lesion_id] = {
-                "type": "primary",
-                "size_mm": baseline_case.primary.size_mm,
-                "site": baseline_case.primary.lobe
-            }
-        
-        # Lymph nodes
-        for i, node in enumerate(baseline_case.nodes):
-            lesion_id = f"ln-{node.station}-shortaxis-{i+1}"
-            prior_findings[lesion_id] = {
-                "type": "node",
-                "size_mm": node.short_axis_mm,
-                "site": node.station
-            }
-        
-        # Metastases
-        for i, met in enumerate(baseline_case.mets):
-            lesion_id = f"{met.site.replace('_', '-')}-longest-{i+1}"
-            prior_findings[lesion_id] = {
-                "type": "metastasis",
-                "size_mm": met.size_mm,
-                "site": met.site
-            }
-        
-        # Generate follow-up case with various changes
-        follow_up_case = generate_case(seed=43, patient_id="MULTI001", visit_number=2)
-        
-        # Modify lesions for different change types
-        if baseline_case.primary:
-            follow_up_case.primary = baseline_case.primary
-            follow_up_case.primary.size_mm = baseline_case.primary.size_mm + 3  # Stable
-        
-        # Modify nodes
-        follow_up_case.nodes = []
-        for i, node in enumerate(baseline_case.nodes):
-            new_node = Node(station=node.station, short_axis_mm=node.short_axis_mm + 2)
-            follow_up_case.nodes.append(new_node)
-        
-        # Modify mets
-        follow_up_case.mets = []
-        for i, met in enumerate(baseline_case.mets):
-            new_met = Met(site=met.site, size_mm=met.size_mm - 1)
-            follow_up_case.mets.append(new_met)
-        
-        # Generate report
-        report = generate_report(follow_up_case, prior_findings=prior_findings)
-        
-        # Check that change information is present for multiple lesion types
-        change_indicators = ["stable", "increased", "decreased", "baseline measurement"]
-        found_changes = sum(1 for indicator in change_indicators if indicator in report)
-        assert found_changes > 0, "No change indicators found in report"
+    @pytest.mark.parametrize("scenario,expected", LONGITUDINAL_SCENARIOS)
+    def test_longitudinal_scenario(self, longitudinal_baseline, follow_up_case_43, scenario, expected):
+        """Test report narrative for a follow-up case against its prior findings"""
+        case, prior_findings = scenario(longitudinal_baseline, follow_up_case_43)
+        report = generate_report(case, prior_findings=prior_findings)
+
+        # Should still generate valid report
+        assert "TECHNIQUE:" in report
+        assert "FINDINGS:" in report
+        assert "IMPRESSION:" in report
+
+        # Change information is integrated into findings, not a separate section
+        assert "LONGITUDINAL COMPARISON:" not in report
+
+        found = extract_keywords(report)
+        for keywords in expected:
+            assert keywords & found, f"None of {sorted(keywords)} found in report"
     
     def test_lesion_id_deterministic_across_runs(self):
         """Test that lesion IDs are deterministic across multiple runs"""
@@ -287,41 +259,6 @@ class TestLongitudinalConsistency:
             assert id1 == id2
         
         for i, (met1, met2) in enumerate(zip(case1.mets, case2.mets)):
-            id1 = f"{met1.site.replace('_', '-')}-longest-{i+1}"
-            id2 = f"{met2.site.replace('_', '-')}-longest-{i+1}"
+            id1 = f"{met1.site_slug}-longest-{i+1}"
+            id2 = f"{met2.site_slug}-longest-{i+1}"
             assert id1 == id2
-    
-    def test_edge_case_empty_prior_findings(self):
-        """Test handling of empty prior findings"""
-        case = generate_case(seed=42, patient_id="EMPTY001", visit_number=2)
-        prior_findings = {}
-        
-        report = generate_report(case, prior_findings=prior_findings)
-        
-        # Should still generate valid report
-        assert "TECHNIQUE:" in report
-        assert "FINDINGS:" in report
-        assert "IMPRESSION:" in report
-        
-        # All lesions should be marked as baseline
-        if case.primary:
-            assert "baseline measurement" in report
-    
-    def test_edge_case_no_prior_findings_parameter(self):
-        """Test handling when prior_findings parameter is None"""
-        case = generate_case(seed=42, patient_id="NONE001", visit_number=2)
-        
-        report = generate_report(case, prior_findings=None)
-        
-        # Should still generate valid report
-        assert "TECHNIQUE:" in report
-        assert "FINDINGS:" in report
-        assert "IMPRESSION:" in report
-        
-        # All lesions should be marked as baseline
-        if case.primary:
-            assert "baseline measurement" in report
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
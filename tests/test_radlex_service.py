@@ -0,0 +1,70 @@
+import pytest
+import time
+
+from synthrad import radlex_service
+from synthrad.radlex_service import RateLimiter
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace time.time/time.sleep in radlex_service with a clock that only advances on sleep"""
+    clock = {"now": 1000.0, "sleeps": []}
+
+    def fake_time():
+        return clock["now"]
+
+    def fake_sleep(seconds):
+        clock["sleeps"].append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(radlex_service.time, "time", fake_time)
+    monkeypatch.setattr(radlex_service.time, "sleep", fake_sleep)
+    return clock
+
+
+class TestRateLimiter:
+    """Test RateLimiter against a fake clock so no test actually sleeps"""
+
+    def test_rate_limiter_unit(self, fake_clock):
+        """Test that back-to-back calls are spaced by 1/calls_per_second"""
+        limiter = RateLimiter(calls_per_second=1.0, calls_per_minute=60)
+
+        for _ in range(5):
+            limiter.wait_if_needed()
+
+        # First call goes through immediately, the other four wait a full second each
+        assert len(fake_clock["sleeps"]) == 4
+        assert sum(fake_clock["sleeps"]) == pytest.approx(4.0)
+
+    def test_rate_limiter_spaced_calls_do_not_wait(self, fake_clock):
+        """Test that calls already spaced out by the caller are not delayed"""
+        limiter = RateLimiter(calls_per_second=2.0, calls_per_minute=60)
+
+        for _ in range(3):
+            limiter.wait_if_needed()
+            fake_clock["now"] += 1.0
+
+        assert fake_clock["sleeps"] == []
+
+    def test_rate_limiter_minute_window(self, fake_clock):
+        """Test that exceeding calls_per_minute waits for the oldest call to leave the window"""
+        limiter = RateLimiter(calls_per_second=1.0, calls_per_minute=3)
+
+        for _ in range(4):
+            limiter.wait_if_needed()
+
+        # Two 1 s spacing waits, then the fourth call waits out the rest of the minute
+        assert sum(fake_clock["sleeps"]) == pytest.approx(60.0)
+        assert fake_clock["now"] - 1000.0 == pytest.approx(60.0)
+
+    @pytest.mark.slow
+    def test_rate_limiting(self):
+        """Test rate limiting against the real clock (~4 s, deselected by default)"""
+        limiter = RateLimiter(calls_per_second=1.0, calls_per_minute=60)
+
+        start = time.time()
+        for _ in range(5):
+            limiter.wait_if_needed()
+        elapsed = time.time() - start
+
+        assert elapsed >= 3.9
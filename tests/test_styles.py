@@ -1,65 +1,67 @@
-import sys
-from pathlib import Path
 import pytest
 import random
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from synthrad.generator import generate_case, generate_report, format_primary, format_nodes, format_mets
+from synthrad.generator import format_primary, format_nodes, format_mets
 from synthrad.lexicons import RADIOLOGIST_STYLES, node_phrase, feature_text
-from synthrad.schema import Primary, Node, Met
+from synthrad.schema import Primary, Met
+
+
+STYLES = ["concise", "detailed"]
+
+REQUIRED_STYLE_KEYS = frozenset({
+    "normal_mediastinum", "normal_pleura", "normal_great_vessels",
+    "normal_abdomen", "normal_bones", "artifact_phrases",
+    "primary_lesion_phrases", "node_phrases", "metastasis_phrases"
+})
+
+
+@pytest.fixture(scope="module")
+def validated_styles():
+    """RADIOLOGIST_STYLES, structurally checked once per module"""
+    for style_name, style_dict in RADIOLOGIST_STYLES.items():
+        assert REQUIRED_STYLE_KEYS.issubset(style_dict), \
+            f"Missing keys {sorted(REQUIRED_STYLE_KEYS - style_dict.keys())} in style {style_name}"
+        assert all(isinstance(style_dict[key], list) and style_dict[key] for key in REQUIRED_STYLE_KEYS), \
+            f"Every required key should be a non-empty list in style {style_name}"
+    return RADIOLOGIST_STYLES
 
 
 class TestRadiologistStyles:
     """Test radiologist style differences and phrase generation"""
     
-    def test_style_dictionary_structure(self):
+    def test_style_dictionary_structure(self, validated_styles):
         """Test that RADIOLOGIST_STYLES has correct structure"""
-        assert "concise" in RADIOLOGIST_STYLES
-        assert "detailed" in RADIOLOGIST_STYLES
-        assert len(RADIOLOGIST_STYLES) == 2
-        
-        # Test that both styles have all required keys
-        required_keys = [
-            "normal_mediastinum", "normal_pleura", "normal_great_vessels",
-            "normal_abdomen", "normal_bones", "artifact_phrases",
-            "primary_lesion_phrases", "node_phrases", "metastasis_phrases"
-        ]
-        
-        for style_name in RADIOLOGIST_STYLES:
-            style_dict = RADIOLOGIST_STYLES[style_name]
-            for key in required_keys:
-                assert key in style_dict, f"Missing key {key} in style {style_name}"
-                assert isinstance(style_dict[key], list), f"Key {key} should be a list in style {style_name}"
-                assert len(style_dict[key]) > 0, f"Key {key} should have content in style {style_name}"
+        # Required keys are checked by the validated_styles fixture
+        assert "concise" in validated_styles
+        assert "detailed" in validated_styles
+        assert len(validated_styles) == 2
     
-    def test_style_phrase_differences(self):
+    def test_style_phrase_differences(self, validated_styles):
         """Test that different styles produce different phrases"""
         # Test normal mediastinum phrases
-        concise_mediastinum = RADIOLOGIST_STYLES["concise"]["normal_mediastinum"]
-        detailed_mediastinum = RADIOLOGIST_STYLES["detailed"]["normal_mediastinum"]
+        concise_mediastinum = validated_styles["concise"]["normal_mediastinum"]
+        detailed_mediastinum = validated_styles["detailed"]["normal_mediastinum"]
         
         assert concise_mediastinum != detailed_mediastinum
         assert len(concise_mediastinum[0]) < len(detailed_mediastinum[0])  # Concise should be shorter
         
         # Test normal pleura phrases
-        concise_pleura = RADIOLOGIST_STYLES["concise"]["normal_pleura"]
-        detailed_pleura = RADIOLOGIST_STYLES["detailed"]["normal_pleura"]
+        concise_pleura = validated_styles["concise"]["normal_pleura"]
+        detailed_pleura = validated_styles["detailed"]["normal_pleura"]
         
         assert concise_pleura != detailed_pleura
         
         # Test artifact phrases
-        concise_artifacts = RADIOLOGIST_STYLES["concise"]["artifact_phrases"]
-        detailed_artifacts = RADIOLOGIST_STYLES["detailed"]["artifact_phrases"]
+        concise_artifacts = validated_styles["concise"]["artifact_phrases"]
+        detailed_artifacts = validated_styles["detailed"]["artifact_phrases"]
         
         assert concise_artifacts != detailed_artifacts
         assert len(concise_artifacts[0]) < len(detailed_artifacts[0])  # Concise should be shorter
     
-    def test_primary_lesion_phrase_differences(self):
+    def test_primary_lesion_phrase_differences(self, validated_styles):
         """Test that primary lesion phrases differ between styles"""
-        concise_phrases = RADIOLOGIST_STYLES["concise"]["primary_lesion_phrases"]
-        detailed_phrases = RADIOLOGIST_STYLES["detailed"]["primary_lesion_phrases"]
+        concise_phrases = validated_styles["concise"]["primary_lesion_phrases"]
+        detailed_phrases = validated_styles["detailed"]["primary_lesion_phrases"]
         
         assert concise_phrases != detailed_phrases
         
@@ -102,10 +104,10 @@ class TestRadiologistStyles:
         assert "subcentimeter" in detailed_result
         assert "pathologic" not in concise_result  # Subcentimeter nodes not pathologic
     
-    def test_metastasis_phrase_differences(self):
+    def test_metastasis_phrase_differences(self, validated_styles):
         """Test that metastasis phrases differ between styles"""
-        concise_phrases = RADIOLOGIST_STYLES["concise"]["metastasis_phrases"]
-        detailed_phrases = RADIOLOGIST_STYLES["detailed"]["metastasis_phrases"]
+        concise_phrases = validated_styles["concise"]["metastasis_phrases"]
+        detailed_phrases = validated_styles["detailed"]["metastasis_phrases"]
         
         assert concise_phrases != detailed_phrases
         
@@ -121,64 +123,46 @@ class TestRadiologistStyles:
         assert "20 mm" in concise_result[0]
         assert "20 mm" in detailed_result[0]
     
-    def test_style_aliases(self):
+    def test_style_aliases(self, cached_report):
         """Test that style aliases work correctly"""
-        # Test that aliases map to correct styles
-        case = generate_case(seed=42)
-        
         # Test clinical -> concise
-        case.meta.radiologist_style = "clinical"
-        clinical_report = generate_report(case)
-        
-        case.meta.radiologist_style = "concise"
-        concise_report = generate_report(case)
+        clinical_report = cached_report(42, "clinical")
+        concise_report = cached_report(42, "concise")
         
         # Should be similar (same style)
         assert "TECHNIQUE:" in clinical_report
         assert "TECHNIQUE:" in concise_report
         
         # Test academic -> detailed
-        case.meta.radiologist_style = "academic"
-        academic_report = generate_report(case)
-        
-        case.meta.radiologist_style = "detailed"
-        detailed_report = generate_report(case)
+        academic_report = cached_report(42, "academic")
+        detailed_report = cached_report(42, "detailed")
         
         # Should be similar (same style)
         assert "TECHNIQUE:" in academic_report
         assert "TECHNIQUE:" in detailed_report
     
-    def test_report_structure_consistency(self):
+    @pytest.mark.parametrize("style", STYLES)
+    def test_report_structure_consistency(self, style, cached_report):
         """Test that all styles produce consistent report structure"""
-        case = generate_case(seed=42)
-        
-        for style_name in ["concise", "detailed"]:
-            case.meta.radiologist_style = style_name
-            report = generate_report(case)
-            
-            # Check required sections
-            assert "TECHNIQUE:" in report
-            assert "COMPARISON:" in report
-            assert "FINDINGS:" in report
-            assert "IMPRESSION:" in report
-            
-            # Check content sections
-            assert "Lungs/Primary:" in report
-            assert "Mediastinum/Lymph nodes:" in report
-            assert "Pleura:" in report
-            assert "Abdomen/Pelvis:" in report
-            assert "Bones:" in report
+        report = cached_report(42, style)
+        
+        # Check required sections
+        assert "TECHNIQUE:" in report
+        assert "COMPARISON:" in report
+        assert "FINDINGS:" in report
+        assert "IMPRESSION:" in report
+        
+        # Check content sections
+        assert "Lungs/Primary:" in report
+        assert "Mediastinum/Lymph nodes:" in report
+        assert "Pleura:" in report
+        assert "Abdomen/Pelvis:" in report
+        assert "Bones:" in report
     
-    def test_style_content_differences(self):
+    def test_style_content_differences(self, cached_report):
         """Test that different styles produce different content"""
-        case = generate_case(seed=42)
-        
-        # Generate reports with different styles
-        case.meta.radiologist_style = "concise"
-        concise_report = generate_report(case)
-        
-        case.meta.radiologist_style = "detailed"
-        detailed_report = generate_report(case)
+        concise_report = cached_report(42, "concise")
+        detailed_report = cached_report(42, "detailed")
         
         # Reports should be different
         assert concise_report != detailed_report
@@ -225,69 +209,42 @@ class TestRadiologistStyles:
         non_pathologic_result = node_phrase("4R", 8, style="detailed")
         assert "Enlarged" not in non_pathologic_result
     
-    def test_style_consistency_across_sections(self):
+    @pytest.mark.parametrize("style", STYLES)
+    def test_style_consistency_across_sections(self, style, cached_report):
         """Test that style is consistent across all report sections"""
-        case = generate_case(seed=42)
-        
-        # Remove nodes to test normal mediastinum phrasing
-        case.nodes = []
-        
-        for style_name in ["concise", "detailed"]:
-            case.meta.radiologist_style = style_name
-            report = generate_report(case)
-            
-            # Check that style-appropriate phrases appear in different sections
-            if style_name == "concise":
-                # Concise style should have shorter, more direct phrases
-                assert "No pathologic mediastinal adenopathy" in report
-            else:
-                # Detailed style should have longer, more descriptive phrases
-                assert "Mediastinum demonstrates normal contours" in report or "No mediastinal mass" in report
+        # Nodes removed to test normal mediastinum phrasing
+        report = cached_report(42, style, "no_nodes")
+        
+        # Check that style-appropriate phrases appear in different sections
+        if style == "concise":
+            # Concise style should have shorter, more direct phrases
+            assert "No pathologic mediastinal adenopathy" in report
+        else:
+            # Detailed style should have longer, more descriptive phrases
+            assert "Mediastinum demonstrates normal contours" in report or "No mediastinal mass" in report
     
-    def test_style_with_different_lesion_types(self):
+    @pytest.mark.parametrize("style", STYLES)
+    def test_style_with_different_lesion_types(self, style, cached_report):
         """Test that styles work correctly with different lesion types"""
-        case = generate_case(seed=42)
-        
-        # Ensure case has nodes and mets for testing
-        if not case.nodes:
-            case.nodes = [Node(station="4R", short_axis_mm=12)]
-        if not case.mets:
-            case.mets = [Met(site="liver", size_mm=20)]
-        
-        for style_name in ["concise", "detailed"]:
-            case.meta.radiologist_style = style_name
-            report = generate_report(case)
-            
-            # Check that all lesion types are described
-            if case.primary:
-                assert "Lungs/Primary:" in report
-            if case.nodes:
-                assert "Mediastinum/Lymph nodes:" in report
-            if case.mets:
-                assert "Abdomen/Pelvis:" in report
+        # Case is given nodes and mets if it has none
+        report = cached_report(42, style, "all_lesion_types")
+        
+        # Check that all lesion types are described
+        assert "Lungs/Primary:" in report
+        assert "Mediastinum/Lymph nodes:" in report
+        assert "Abdomen/Pelvis:" in report
     
-    def test_style_with_empty_lesions(self):
+    @pytest.mark.parametrize("style", STYLES)
+    def test_style_with_empty_lesions(self, style, cached_report):
         """Test that styles work correctly with empty lesion lists"""
-        case = generate_case(seed=42)
-        
-        # Remove all lesions
-        case.primary = None
-        case.nodes = []
-        case.mets = []
-        
-        for style_name in ["concise", "detailed"]:
-            case.meta.radiologist_style = style_name
-            report = generate_report(case)
-            
-            # Should still generate valid report
-            assert "TECHNIQUE:" in report
-            assert "FINDINGS:" in report
-            assert "IMPRESSION:" in report
-            
-            # Should have normal findings
-            assert "Clear lungs" in report
-            assert "No pathologic mediastinal adenopathy" in report or "Mediastinum demonstrates normal contours" in report or "No mediastinal mass or pathologic adenopathy identified" in report
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
+        # All lesions removed
+        report = cached_report(42, style, "no_lesions")
+        
+        # Should still generate valid report
+        assert "TECHNIQUE:" in report
+        assert "FINDINGS:" in report
+        assert "IMPRESSION:" in report
+        
+        # Should have normal findings
+        assert "Clear lungs" in report
+        assert "No pathologic mediastinal adenopathy" in report or "Mediastinum demonstrates normal contours" in report or "No mediastinal mass or pathologic adenopathy identified" in report
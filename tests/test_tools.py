@@ -0,0 +1,266 @@
+import argparse
+
+import pytest
+
+from tools.generators import generate
+from tools.utils.config_manager import ConfigManager, ConfigSet, SynthRadConfig, create_config_from_dict
+
+
+class TestConfigManager:
+    """Test configuration loading and validation in tools/utils/config_manager.py"""
+
+    def test_user_data_cannot_mark_config_trusted(self):
+        """Test that private keys such as _trusted are rejected instead of skipping validation"""
+        data = {"configurations": [
+            {"name": "a", "output_dir": "out/a", "stage_distribution": "X:1", "_trusted": True}
+        ]}
+        with pytest.raises(ValueError, match="_trusted"):
+            ConfigManager._config_set_from_dict(data)
+        with pytest.raises(ValueError, match="_trusted"):
+            create_config_from_dict({"name": "a", "out": "out/a", "_trusted": True})
+
+    def test_save_json_with_non_string_metadata_keys(self, out_dir):
+        """Test that metadata keys such as integers from YAML are written as strings"""
+        config_set = ConfigSet(name="set", metadata={1: "one"})
+        path = out_dir / "configs.json"
+        ConfigManager.save_to_json(config_set, str(path))
+        assert ConfigManager.load_from_json(str(path)).metadata == {"1": "one"}
+
+    def test_summarize_matches_loaded_summary(self, out_dir, capsys):
+        """Test that the raw-file summary matches the summary of the loaded set, defaults included"""
+        path = out_dir / "configs.json"
+        path.write_text('{"name": "set", "configurations": [{"name": "a", "output_dir": "out/a", "tags": ["x"]}]}')
+
+        ConfigManager.summarize(str(path))
+        raw_summary = capsys.readouterr().out
+        generate.print_config_summary(ConfigManager.load_from_json(str(path)))
+
+        assert raw_summary == capsys.readouterr().out
+        assert f"Patients: {SynthRadConfig(name='a', output_dir='out/a').num_patients}" in raw_summary
+
+    @pytest.mark.parametrize("dist", ["I:1", "I:1.", "I:.5", "I:1e-3", " I : 0.5 , II:0.5 "])
+    def test_distribution_accepts_float_values(self, dist):
+        """Test that any unsigned number float() accepts is a valid distribution value"""
+        assert SynthRadConfig(name="a", output_dir="out/a", stage_distribution=dist).stage_distribution == dist
+
+    @pytest.mark.parametrize("dist", ["I:-1", "I:1e", "I:.", "I:", "X:1", "I:1,,II:1"])
+    def test_distribution_rejects_invalid(self, dist):
+        """Test that malformed values, negative values and unknown keys are rejected"""
+        with pytest.raises(ValueError):
+            SynthRadConfig(name="a", output_dir="out/a", stage_distribution=dist)
+
+    def test_builtin_configs_skip_revalidation(self):
+        """Test that the built-in sample/research tables still build"""
+        assert ConfigManager.create_sample_configs().configs
+        assert ConfigManager.create_research_configs().configs
+
+
+
+class TestConfigSetLookup:
+    """Test ConfigSet.get_config_by_name and its cached name index"""
+
+    @staticmethod
+    def _config(name, seed=42):
+        return SynthRadConfig(name=name, output_dir=f"out/{name}", seed=seed)
+
+    def test_lookup(self):
+        """Test that configurations are found by name and unknown names return None"""
+        config_set = ConfigSet(name="set", configs=[self._config("a"), self._config("b")])
+        assert config_set.get_config_by_name("b").name == "b"
+        assert config_set.get_config_by_name("missing") is None
+
+    def test_index_rebuilt_after_add_config(self):
+        """Test that add_config invalidates the index"""
+        config_set = ConfigSet(name="set", configs=[self._config("a")])
+        assert config_set.get_config_by_name("b") is None
+        config_set.add_config(self._config("b"))
+        assert config_set.get_config_by_name("b").name == "b"
+
+    def test_index_rebuilt_after_replacing_configs(self):
+        """Test that assigning a new configs list invalidates the index"""
+        config_set = ConfigSet(name="set", configs=[self._config("a"), self._config("b")])
+        assert config_set.get_config_by_name("a") is not None
+        config_set.configs = [self._config("c")]
+        assert config_set.get_config_by_name("a") is None
+        assert config_set.get_config_by_name("c").name == "c"
+
+    def test_index_rebuilt_after_reassigning_edited_copy(self):
+        """Test that an edited copy assigned back to configs is seen, including replaced items"""
+        config_set = ConfigSet(name="set", configs=[self._config("a"), self._config("b")])
+        assert config_set.get_config_by_name("c") is None
+        configs = list(config_set.configs)
+        configs[1] = self._config("c")
+        config_set.configs = configs
+        assert config_set.get_config_by_name("c").name == "c"
+        assert config_set.get_config_by_name("b") is None
+
+    def test_first_duplicate_name_wins(self):
+        """Test that the first configuration with a duplicated name is returned, as with a linear scan"""
+        config_set = ConfigSet(name="set", configs=[self._config("a", seed=1), self._config("a", seed=2)])
+        assert config_set.get_config_by_name("a").seed == 1
+
+
+class TestWorkerPool:
+    """Test worker pool selection in tools/generators/generate.py"""
+
+    def test_loky_executor_arguments(self, monkeypatch):
+        """Test that loky's reusable executor gets the worker initializer and no idle timeout"""
+        calls = []
+        monkeypatch.setattr(generate, "_HAVE_LOKY", True)
+        monkeypatch.setattr(generate, "_get_reusable_executor", lambda **kwargs: calls.append(kwargs) or "pool",
+                            raising=False)
+
+        assert generate._get_pool(2, "list:0:1") == "pool"
+        assert calls == [{
+            "max_workers": 2, "timeout": None,
+            "initializer": generate._worker_init, "initargs": (((0,), (1,)),),
+        }]
+
+
+def _tiny_config(out_dir, name, **settings):
+    """One-patient configuration without RadLex, writing under out_dir"""
+    return SynthRadConfig(name=name, output_dir=str(out_dir / name), num_patients=1, use_radlex=False, **settings)
+
+
+class TestParallelDispatch:
+    """Test how run_configs_parallel ranks, chunks and collects configurations"""
+
+    def test_chunks_deal_most_expensive_first(self, out_dir):
+        """Test that the most expensive configurations start separate chunks and every config appears once"""
+        configs = [SynthRadConfig(name=f"c{n}", output_dir=str(out_dir / f"c{n}"), num_patients=n)
+                   for n in range(1, 11)]
+        chunks = generate._dispatch_chunks(configs, max_workers=1)
+
+        assert len(chunks) == 4
+        assert [chunk[0].num_patients for chunk in chunks] == [10, 9, 8, 7]
+        assert [config.num_patients for config in chunks[0]] == [10, 6, 2]
+        assert sorted(config.name for chunk in chunks for config in chunk) == sorted(c.name for c in configs)
+
+    def test_chunks_for_few_configs(self, out_dir):
+        """Test that there are never more chunks than configurations"""
+        assert generate._dispatch_chunks([], max_workers=4) == []
+        assert len(generate._dispatch_chunks([_tiny_config(out_dir, "a")], max_workers=4)) == 1
+
+    def test_results_in_input_order(self, out_dir):
+        """Test that parallel results are keyed and ordered like config_set.configs"""
+        configs = [_tiny_config(out_dir, "small"), _tiny_config(out_dir, "large", studies_per_patient=10, follow_up=True)]
+        config_set = ConfigSet(name="set", configs=configs)
+
+        results = generate.run_configs_parallel(config_set, max_workers=2)
+
+        assert list(results.items()) == [("small", True), ("large", True)]
+        assert list((out_dir / "large").rglob("*.txt"))
+
+    def test_pool_failure_marks_every_config_failed(self, out_dir, monkeypatch, capsys):
+        """Test that an exception from the pool marks every configuration as failed"""
+        class BrokenPool:
+            def map(self, *args, **kwargs):
+                raise RuntimeError("pool broke")
+
+        monkeypatch.setattr(generate, "_get_pool", lambda *args: BrokenPool())
+        config_set = ConfigSet(name="set", configs=[_tiny_config(out_dir, "a"), _tiny_config(out_dir, "b")])
+
+        assert generate.run_configs_parallel(config_set, max_workers=2) == {"a": False, "b": False}
+        assert "pool broke" in capsys.readouterr().out
+
+
+class TestSingleRun:
+    """Test run_single_config in-process and with --isolate"""
+
+    def test_in_process_success(self, out_dir, capsys):
+        """Test that an in-process run succeeds and reports its output directory"""
+        assert generate.run_single_config(_tiny_config(out_dir, "a")) is True
+        assert "✓ a: Successfully generated reports" in capsys.readouterr().out
+        assert list((out_dir / "a").rglob("*.txt"))
+
+    def test_in_process_failure_shows_stdout_error(self, out_dir, capsys):
+        """Test that an error synthrad prints on stdout is shown when stderr is empty"""
+        config = _tiny_config(out_dir, "a")
+        # SynthRadConfig rejects this value itself, so set it past validation to reach synthrad's own check
+        object.__setattr__(config, "studies_per_patient", 1)
+
+        assert generate.run_single_config(config) is False
+        out = capsys.readouterr().out
+        assert "✗ a: Failed with error:" in out
+        assert "studies-per-patient must be between 2 and 10" in out
+
+    def test_isolated_success_streams_prefixed_output(self, out_dir, capfd, monkeypatch):
+        """Test that an isolated run finds synthrad from the checkout and streams its output prefixed"""
+        monkeypatch.delenv("PYTHONPATH", raising=False)
+        # The JSONL export is one of the few things synthrad prints on success
+        config = _tiny_config(out_dir, "iso", jsonl_filename="cohort.jsonl")
+        assert generate.run_single_config(config, isolate=True) is True
+        out = capfd.readouterr().out
+        assert "[iso] Created traditional JSONL file:" in out
+        assert "✓ iso: Successfully generated reports" in out
+
+    def test_isolated_failure_shows_output_tail(self, out_dir, capfd):
+        """Test that an isolated failure reports the tail of the child's output"""
+        config = _tiny_config(out_dir, "iso")
+        object.__setattr__(config, "studies_per_patient", 1)
+
+        assert generate.run_single_config(config, isolate=True) is False
+        out = capfd.readouterr().out
+        assert "[iso] Error: studies-per-patient must be between 2 and 10" in out
+        failure = out.split("✗ iso: Failed with error:")[1]
+        assert "studies-per-patient must be between 2 and 10" in failure
+
+
+class TestSequentialRuns:
+    """Test in-process sequential runs through synthrad.iter_batch"""
+
+    def test_results_and_per_config_output(self, out_dir, capsys):
+        """Test that each configuration gets its own status, timing and captured error output"""
+        config_set = ConfigSet(name="set", configs=[
+            _tiny_config(out_dir, "good"),
+            _tiny_config(out_dir, "bad", stage_distribution="I:0,II:0,III:0,IV:0"),
+        ])
+
+        assert generate.run_configs_sequential(config_set) == {"good": True, "bad": False}
+
+        out = capsys.readouterr().out
+        good_report, bad_report = out.split("Running bad:")
+        assert "✓ good: Successfully generated reports in" in good_report
+        assert "stage distribution must sum > 0" not in good_report
+        assert "✗ bad: Failed with error:" in bad_report
+        assert "stage distribution must sum > 0" in bad_report
+        assert list((out_dir / "good").rglob("*.txt"))
+
+
+class TestCpuAffinity:
+    """Test --cpu-affinity parsing in tools/generators/generate.py"""
+
+    @pytest.mark.parametrize("spec", ["none", "block", "list:0-3:4-7", "list:0-1,4,6-7"])
+    def test_valid_specs(self, spec):
+        """Test that valid specs are returned unchanged"""
+        assert generate.parse_cpu_affinity(spec) == spec
+
+    @pytest.mark.parametrize("spec", ["", "all", "list:", "list:a-b", "list:0-3:", "list:0-3,,4"])
+    def test_invalid_specs(self, spec):
+        """Test that invalid specs are reported as argparse errors"""
+        with pytest.raises(argparse.ArgumentTypeError):
+            generate.parse_cpu_affinity(spec)
+
+    def test_parse_cpu_group(self):
+        """Test that a CPU group expands ranges and single CPUs in order"""
+        assert generate._parse_cpu_group("0-3,8,10-11") == [0, 1, 2, 3, 8, 10, 11]
+        assert generate._parse_cpu_group("5") == [5]
+
+    def test_list_cpu_sets(self):
+        """Test that each list group becomes one worker's CPU set"""
+        assert generate._cpu_sets("none", 4) is None
+        assert generate._cpu_sets("list:0-1:2,5", None) == ((0, 1), (2, 5))
+
+    def test_block_cpu_sets(self, monkeypatch):
+        """Test that block splits the available CPUs into contiguous per-worker blocks"""
+        monkeypatch.setattr(generate.os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+        assert generate._cpu_sets("block", 4) == ((0, 1), (2, 3), (4, 5), (6, 7))
+        assert generate._cpu_sets("block", 3) == ((0, 1, 2), (3, 4, 5), (6, 7))
+        # Uneven splits still give every worker its own set, sizes differing by at most one
+        monkeypatch.setattr(generate.os, "sched_getaffinity", lambda pid: set(range(12)), raising=False)
+        assert generate._cpu_sets("block", 5) == ((0, 1, 2), (3, 4, 5), (6, 7), (8, 9), (10, 11))
+        monkeypatch.setattr(generate.os, "sched_getaffinity", lambda pid: set(range(10)), raising=False)
+        assert len(generate._cpu_sets("block", 6)) == 6
+        monkeypatch.setattr(generate.os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+        # More workers than CPUs still gives one CPU per set
+        assert generate._cpu_sets("block", 16) == tuple((cpu,) for cpu in range(8))
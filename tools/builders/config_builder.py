@@ -14,22 +14,24 @@ from typing import List, Dict, Any
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from tools.utils.config_manager import SynthRadConfig, ConfigSet, ConfigManager
+from tools.utils.config_manager import SynthRadConfig, ConfigSet, ConfigManager, check_distribution
+
+
+def _read(prompt: str) -> str:
+    """Read one line of user input, stripped of surrounding whitespace."""
+    return input(prompt).strip()
 
 
 def get_user_input(prompt: str, default: str = "", required: bool = True) -> str:
     """Get user input with optional default value."""
+    _input, _print = _read, print
+    prompt_line = f"{prompt} [{default}]: " if default else f"{prompt}: "
     while True:
-        if default:
-            user_input = input(f"{prompt} [{default}]: ").strip()
-            if not user_input:
-                user_input = default
-        else:
-            user_input = input(f"{prompt}: ").strip()
+        user_input = _input(prompt_line) or default
         
         if user_input or not required:
             return user_input
-        print("This field is required. Please enter a value.")
+        _print("This field is required. Please enter a value.")
 
 
 def get_choice(prompt: str, choices: List[str], default: int = 0) -> str:
@@ -39,60 +41,55 @@ def get_choice(prompt: str, choices: List[str], default: int = 0) -> str:
         marker = ">" if i == default else " "
         print(f"  {marker} {i+1}. {choice}")
     
+    prompt_line = f"Enter choice (1-{len(choices)}) [{default+1}]: "
+    range_hint = f"Please enter a number between 1 and {len(choices)}"
+    valid_range = range(1, len(choices) + 1)
+    _input, _print = _read, print
     while True:
         try:
-            choice = input(f"Enter choice (1-{len(choices)}) [{default+1}]: ").strip()
+            choice = _input(prompt_line)
             if not choice:
                 choice = default + 1
             else:
                 choice = int(choice)
             
-            if 1 <= choice <= len(choices):
+            if choice in valid_range:
                 return choices[choice - 1]
             else:
-                print(f"Please enter a number between 1 and {len(choices)}")
+                _print(range_hint)
         except ValueError:
-            print("Please enter a valid number")
+            _print("Please enter a valid number")
 
 
 def get_distribution(prompt: str, valid_keys: List[str], example: str) -> str:
     """Get a distribution string from user input."""
+    key_set = frozenset(valid_keys)
     print(f"\n{prompt}")
     print(f"Valid keys: {', '.join(valid_keys)}")
     print(f"Example format: {example}")
     print("Enter distribution as 'key:value,key:value' or press Enter for default")
     
+    _input, _print = _read, print
     while True:
-        dist = input("Distribution: ").strip()
+        dist = _input("Distribution: ")
         if not dist:
             return ""
         
+        # Same check SynthRadConfig applies, so an accepted value can't fail later
         try:
-            # Basic validation
-            parts = dist.split(",")
-            for part in parts:
-                key, value = part.split(":")
-                key = key.strip()
-                value = float(value.strip())
-                
-                if key not in valid_keys:
-                    print(f"Invalid key '{key}'. Valid keys: {valid_keys}")
-                    break
-                
-                if value < 0:
-                    print("Values must be non-negative")
-                    break
-            else:
-                return dist
-        except (ValueError, AttributeError):
-            print("Invalid format. Use 'key:value,key:value' format")
+            check_distribution(dist, key_set)
+        except ValueError as e:
+            _print(f"{e}. Valid keys: {valid_keys}")
+            continue
+        
+        return dist
 
 
 def get_tags() -> List[str]:
     """Get tags from user input."""
     print("\nEnter tags (comma-separated) to categorize this configuration:")
     print("Examples: baseline, followup, radlex, research, clinical-trial")
-    tags_input = input("Tags: ").strip()
+    tags_input = _read("Tags: ")
     
     if tags_input:
         return [tag.strip() for tag in tags_input.split(",")]
@@ -13,47 +13,126 @@ Usage:
 """
 
 import os
+import io
 import sys
+import math
 import json
 import subprocess
 import argparse
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
-from typing import Dict, List, Any
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+import multiprocessing
+import threading
 import time
+from collections import deque
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Make synthrad (src/) and the tools package importable, once each
+_ROOT = Path(__file__).resolve().parents[2]
+for _path in (str(_ROOT / "src"), str(_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 # Import our clean configuration system
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from tools.utils.config_manager import ConfigManager, ConfigSet, SynthRadConfig, create_config_from_dict
 
+# loky's reusable executor survives crashed workers and keeps its workers between runs
+try:
+    from loky import get_reusable_executor as _get_reusable_executor
+    _HAVE_LOKY = True
+except ImportError:
+    _HAVE_LOKY = False
+
+
+def _error_output(err: str, out: str) -> str:
+    """Pick the output to show for a failed run."""
+    # synthrad reports some errors on stdout, so fall back to it when stderr is empty
+    return err or out
+
+
+def _run_in_process(args: List[str]) -> Tuple[int, str]:
+    """Run synthrad in this interpreter, returning (exit status, captured error output)."""
+    from synthrad.cli import run
+    
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        returncode = run(args)
+    return returncode, _error_output(err.getvalue(), out.getvalue())
+
+
+# Lines of child output kept per stream for the failure message
+_OUTPUT_TAIL_LINES = 200
+
+
+def _pump(stream, sink, name: str, tail: deque):
+    """Forward a child's output line by line, prefixed with the config name, keeping a bounded tail."""
+    for line in stream:
+        sink.write(f"[{name}] {line}")
+        tail.append(line)
+
+
+def _run_isolated(name: str, args: List[str]) -> Tuple[int, str]:
+    """Run synthrad in a fresh interpreter, returning (exit status, tail of its error output).
+    
+    Output is streamed to this process as it is produced rather than buffered
+    until the child exits.
+    """
+    cmd = [sys.executable, "-m", "synthrad"] + args
+    # src/ goes first on the child's path so a checkout works without installing synthrad
+    python_path = os.pathsep.join(filter(None, [str(_ROOT / "src"), os.environ.get("PYTHONPATH")]))
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors="replace",
+        bufsize=1, env={**os.environ, "PYTHONPATH": python_path, "PYTHONUNBUFFERED": "1"}
+    )
+    out_tail, err_tail = deque(maxlen=_OUTPUT_TAIL_LINES), deque(maxlen=_OUTPUT_TAIL_LINES)
+    pumps = [
+        threading.Thread(target=_pump, args=(proc.stdout, sys.stdout, name, out_tail), daemon=True),
+        threading.Thread(target=_pump, args=(proc.stderr, sys.stderr, name, err_tail), daemon=True),
+    ]
+    for pump in pumps:
+        pump.start()
+    returncode = proc.wait()
+    for pump in pumps:
+        pump.join()
+    return returncode, _error_output("".join(err_tail), "".join(out_tail))
+
+
+def _print_config_details(config: SynthRadConfig):
+    """Print where a successful configuration wrote its output and how it is labelled."""
+    print(f"  Output directory: {config.output_dir}")
+    if config.description:
+        print(f"  Description: {config.description}")
+    if config.tags:
+        print(f"  Tags: {', '.join(config.tags)}")
+
 
-def run_single_config(config: SynthRadConfig) -> bool:
-    """Run a single configuration and return success status."""
+def run_single_config(config: SynthRadConfig, isolate: bool = False) -> bool:
+    """Run a single configuration and return success status.
+    
+    Configurations run in-process by default; isolate=True launches a separate
+    `python -m synthrad` interpreter for each one instead.
+    """
     try:
-        # Build command using the clean config system
-        cmd = [sys.executable, "-m", "synthrad"] + config.to_synthrad_args()
+        args = config.to_synthrad_args()
         
-        print(f"Running {config.name}: {' '.join(cmd)}")
+        if isolate:
+            print(f"Running {config.name}: {sys.executable} -m synthrad {' '.join(args)}")
+        else:
+            print(f"Running {config.name}: synthrad {' '.join(args)}")
         
         start_time = time.time()
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        returncode, error_output = _run_isolated(config.name, args) if isolate else _run_in_process(args)
         end_time = time.time()
         
-        if result.returncode == 0:
+        if returncode == 0:
             print(f"✓ {config.name}: Successfully generated reports in {end_time - start_time:.2f}s")
-            print(f"  Output directory: {config.output_dir}")
-            if config.description:
-                print(f"  Description: {config.description}")
-            if config.tags:
-                print(f"  Tags: {', '.join(config.tags)}")
+            _print_config_details(config)
             return True
         else:
             print(f"✗ {config.name}: Failed with error:")
-            print(f"  {result.stderr}")
+            print(f"  {error_output}")
             return False
             
     except Exception as e:
@@ -61,8 +140,13 @@ def run_single_config(config: SynthRadConfig) -> bool:
         return False
 
 
-def run_configs_sequential(config_set: ConfigSet) -> Dict[str, bool]:
-    """Run configurations sequentially."""
+def run_configs_sequential(config_set: ConfigSet, isolate: bool = False) -> Dict[str, bool]:
+    """Run configurations sequentially.
+    
+    In-process runs share one synthrad.iter_batch, which initializes RadLex
+    once for the whole set; isolate=True runs each configuration in its own
+    process instead.
+    """
     results = {}
     
     print(f"Running {len(config_set.configs)} configurations sequentially...")
@@ -71,14 +155,155 @@ def run_configs_sequential(config_set: ConfigSet) -> Dict[str, bool]:
         print(f"Description: {config_set.description}")
     print("=" * 60)
     
-    for config in config_set.configs:
-        results[config.name] = run_single_config(config)
+    if isolate:
+        for config in config_set.configs:
+            results[config.name] = run_single_config(config, isolate)
+            print()
+        return results
+    
+    configs = config_set.configs
+    try:
+        from synthrad import iter_batch
+    except Exception as e:
+        print(f"✗ Exception in batch run: {e}")
+        return {config.name: False for config in configs}
+    
+    # Each run happens on next(), so its output and timing are captured per configuration
+    runs = iter_batch(config.to_synthrad_args() for config in configs)
+    batch_start = time.time()
+    for config in configs:
+        print(f"Running {config.name}: synthrad {' '.join(config.to_synthrad_args())}")
+        out, err = io.StringIO(), io.StringIO()
+        start_time = time.time()
+        with redirect_stdout(out), redirect_stderr(err):
+            returncode = next(runs)
+        end_time = time.time()
+        
+        results[config.name] = returncode == 0
+        if returncode == 0:
+            print(f"✓ {config.name}: Successfully generated reports in {end_time - start_time:.2f}s")
+            _print_config_details(config)
+        else:
+            print(f"✗ {config.name}: Failed with error:")
+            print(f"  {_error_output(err.getvalue(), out.getvalue())}")
         print()
     
+    print(f"Batch of {len(configs)} configurations finished in {time.time() - batch_start:.2f}s")
+    
     return results
 
 
-def run_configs_parallel(config_set: ConfigSet, max_workers: int = None) -> Dict[str, bool]:
+# Worker pool shared by every parallel run in this process, created on first use
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_KEY: Optional[Tuple] = None
+
+
+def parse_cpu_affinity(spec: str) -> str:
+    """Validate a --cpu-affinity value: 'none', 'block' or 'list:0-7:8-15:...'."""
+    if spec in ("none", "block"):
+        return spec
+    if spec.startswith("list:") and spec[5:]:
+        try:
+            for group in spec[5:].split(":"):
+                _parse_cpu_group(group)
+            return spec
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(f"invalid CPU affinity '{spec}' (use none, block or list:0-7:8-15)")
+
+
+def _parse_cpu_group(group: str) -> List[int]:
+    """Parse one CPU group such as '0-7' or '0-3,8,10-11' into CPU numbers."""
+    cpus = []
+    for part in group.split(","):
+        start, _, end = part.partition("-")
+        cpus.extend(range(int(start), int(end or start) + 1))
+    if not cpus:
+        raise ValueError(f"empty CPU group '{group}'")
+    return cpus
+
+
+def _cpu_sets(spec: str, max_workers: Optional[int]) -> Optional[Tuple[Tuple[int, ...], ...]]:
+    """CPU set for each worker slot, or None to leave placement to the OS."""
+    if spec == "none":
+        return None
+    if spec == "block":
+        available = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+        n_workers = min(max_workers or len(available), len(available))
+        # Exactly one contiguous set per worker; the first `extra` sets take one CPU more
+        size, extra = divmod(len(available), n_workers)
+        bounds = [i * size + min(i, extra) for i in range(n_workers + 1)]
+        return tuple(tuple(available[bounds[i]:bounds[i + 1]]) for i in range(n_workers))
+    return tuple(tuple(_parse_cpu_group(group)) for group in spec[5:].split(":"))
+
+
+def _pin_worker(cpu_sets: Tuple[Tuple[int, ...], ...]):
+    """Pin the calling worker to its CPU set, chosen by worker index."""
+    # Pool workers are numbered from 1; the numbering keeps going if the pool is recreated
+    cpus = cpu_sets[(multiprocessing.current_process()._identity[0] - 1) % len(cpu_sets)]
+    try:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+        else:
+            import psutil
+            psutil.Process().cpu_affinity(list(cpus))
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Warning: could not pin worker to CPUs {list(cpus)}: {e}")
+
+
+def _worker_init(cpu_sets: Optional[Tuple[Tuple[int, ...], ...]] = None):
+    """Pin the worker if requested, then import synthrad once so the first configuration doesn't pay for it."""
+    if cpu_sets:
+        _pin_worker(cpu_sets)
+    try:
+        import synthrad.generator  # noqa: F401
+    except ImportError:
+        # Reported per configuration when it runs; --isolate doesn't need it here
+        pass
+
+
+def _get_pool(max_workers: Optional[int], cpu_affinity: str = "none") -> Executor:
+    """Return the shared worker pool, recreating it only if its settings change."""
+    global _POOL, _POOL_KEY
+    cpu_sets = _cpu_sets(cpu_affinity, max_workers)
+    if _HAVE_LOKY:
+        # loky keeps its own reusable pool and only restarts it when these arguments change;
+        # no idle timeout, so warmed-up (and pinned) workers survive between runs
+        return _get_reusable_executor(max_workers=max_workers or os.cpu_count(), timeout=None,
+                                      initializer=_worker_init, initargs=(cpu_sets,))
+    key = (max_workers, cpu_sets)
+    if _POOL is None or _POOL_KEY != key:
+        if _POOL is not None:
+            _POOL.shutdown()
+        _POOL = ProcessPoolExecutor(max_workers=max_workers, initializer=_worker_init, initargs=(cpu_sets,))
+        _POOL_KEY = key
+    return _POOL
+
+
+def _estimated_cost(config: SynthRadConfig) -> int:
+    """Rough relative run time of a configuration: studies generated, doubled for follow-up."""
+    return config.num_patients * config.studies_per_patient * (2 if config.follow_up else 1)
+
+
+def _dispatch_chunks(configs: List[SynthRadConfig], max_workers: Optional[int]) -> List[List[SynthRadConfig]]:
+    """Split configurations into chunks for the pool, about four per worker, most expensive first.
+    
+    The ranked configurations are dealt out round-robin, so the most expensive ones land in
+    different chunks and each chunk mixes large and small configurations.
+    """
+    # Longest first, so the expensive configurations start early and cheap ones fill in at the end
+    ranked = sorted(configs, key=_estimated_cost, reverse=True)
+    n_chunks = min(len(ranked), 4 * (max_workers or os.cpu_count() or 1))
+    return [ranked[i::n_chunks] for i in range(n_chunks)]
+
+
+def _run_config_chunk(configs: List[SynthRadConfig], isolate: bool = False) -> List[bool]:
+    """Run a chunk of configurations one after another in a worker."""
+    return [run_single_config(config, isolate) for config in configs]
+
+
+def run_configs_parallel(config_set: ConfigSet, max_workers: int = None, isolate: bool = False,
+                         cpu_affinity: str = "none") -> Dict[str, bool]:
     """Run configurations in parallel."""
     results = {}
     
@@ -88,23 +313,21 @@ def run_configs_parallel(config_set: ConfigSet, max_workers: int = None) -> Dict
         print(f"Description: {config_set.description}")
     print("=" * 60)
     
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_config = {
-            executor.submit(run_single_config, config): config 
-            for config in config_set.configs
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_config):
-            config = future_to_config[future]
-            try:
-                results[config.name] = future.result()
-            except Exception as e:
-                print(f"✗ {config.name}: Exception in parallel execution: {e}")
-                results[config.name] = False
+    chunks = _dispatch_chunks(config_set.configs, max_workers)
+    executor = _get_pool(max_workers, cpu_affinity)
     
-    return results
+    # run_single_config reports its own failures, so an exception here means the pool broke
+    try:
+        for chunk, successes in zip(chunks, executor.map(_run_config_chunk, chunks, repeat(isolate))):
+            for config, success in zip(chunk, successes):
+                results[config.name] = success
+    except Exception as e:
+        print(f"✗ Exception in parallel execution: {e}")
+        for config in config_set.configs:
+            results.setdefault(config.name, False)
+    
+    # Report in the order the configurations were given, not the order they ran
+    return {config.name: results[config.name] for config in config_set.configs}
 
 
 def load_config_set(file_path: str) -> ConfigSet:
@@ -122,23 +345,7 @@ def load_config_set(file_path: str) -> ConfigSet:
 
 def print_config_summary(config_set: ConfigSet):
     """Print a summary of the configuration set."""
-    print(f"\nConfiguration Set: {config_set.name}")
-    if config_set.description:
-        print(f"Description: {config_set.description}")
-    
-    if config_set.metadata:
-        print(f"Metadata: {config_set.metadata}")
-    
-    print(f"\nConfigurations ({len(config_set.configs)}):")
-    for i, config in enumerate(config_set.configs, 1):
-        print(f"  {i}. {config.name}")
-        if config.description:
-            print(f"     {config.description}")
-        print(f"     Output: {config.output_dir}")
-        print(f"     Patients: {config.num_patients}")
-        if config.tags:
-            print(f"     Tags: {', '.join(config.tags)}")
-        print()
+    ConfigManager.print_summary(config_set.to_dict())
 
 
 def main():
@@ -179,7 +386,6 @@ Configuration file format (JSON/YAML):
       "follow_up": true,
       "studies_per_patient": 4,
       "response_distribution": "CR:0.1,PR:0.3,SD:0.4,PD:0.2",
-      "radlex_distribution": "standard:0.6,aggressive:0.3,conservative:0.1",
       "jsonl_filename": "cohort_labels.jsonl",
       "tags": ["baseline", "standard"]
     }
@@ -196,6 +402,9 @@ Configuration file format (JSON/YAML):
     parser.add_argument("--tags", type=str, help="Comma-separated list of tags to filter configurations")
     parser.add_argument("--names", type=str, help="Comma-separated list of configuration names to run")
     parser.add_argument("--summary", action="store_true", help="Show configuration summary without running")
+    parser.add_argument("--cpu-affinity", type=parse_cpu_affinity, default="none",
+                        help="Pin parallel workers to CPUs: none, block (split available CPUs evenly) or list:0-7:8-15 (one group per worker)")
+    parser.add_argument("--isolate", action="store_true", help="Run each configuration in a separate synthrad process instead of in-process")
     
     args = parser.parse_args()
     
@@ -224,6 +433,17 @@ Configuration file format (JSON/YAML):
     if not args.configs:
         parser.error("Please provide a configuration file with --configs or use --create-sample/--create-research to create one")
     
+    # A plain summary only needs the raw file, not validated configurations
+    if args.summary and not (args.tags or args.names):
+        if not Path(args.configs).exists():
+            print(f"Error loading configuration file: Configuration file not found: {args.configs}")
+            return
+        try:
+            ConfigManager.summarize(args.configs)
+        except Exception as e:
+            print(f"Error loading configuration file: {e}")
+        return
+    
     # Load configuration set
     try:
         config_set = load_config_set(args.configs)
@@ -269,9 +489,9 @@ Configuration file format (JSON/YAML):
     start_time = time.time()
     
     if args.parallel:
-        results = run_configs_parallel(config_set, args.max_workers)
+        results = run_configs_parallel(config_set, args.max_workers, args.isolate, args.cpu_affinity)
     else:
-        results = run_configs_sequential(config_set)
+        results = run_configs_sequential(config_set, args.isolate)
     
     end_time = time.time()
     
@@ -8,15 +8,74 @@ SynthRad configurations with validation and easy serialization.
 
 import json
 import os
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Optional, Any
+import re
+import sys
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import yaml
 
+# Use the libyaml-backed safe loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
-@dataclass
+# Use orjson for JSON config files when it is installed; both paths read and write bytes
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        # OPT_NON_STR_KEYS coerces e.g. integer YAML keys to strings, as the json module does
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# synthrad CLI defaults; options left at these values are not passed on the command line
+_DEFAULT_STAGE_DIST = "I:0.25,II:0.25,III:0.30,IV:0.20"
+_DEFAULT_RESPONSE_DIST = "CR:0.1,PR:0.3,SD:0.4,PD:0.2"
+_DEFAULT_FOLLOW_UP_DAYS = 90
+_DEFAULT_STUDIES_PER_PATIENT = 5
+
+_STAGE_KEYS = frozenset({"I", "II", "III", "IV"})
+_RESPONSE_KEYS = frozenset({"CR", "PR", "SD", "PD"})
+
+# One "key:value" pair of a distribution string, and a whole comma-separated distribution.
+# Values take any unsigned number float() accepts, such as 1, 1., .5 or 1e-3
+_DIST_PAIR = r"\s*([A-Za-z]+)\s*:\s*((?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)\s*"
+_DIST_RE = re.compile(_DIST_PAIR)
+_DIST_FULL_RE = re.compile(rf"{_DIST_PAIR}(?:,{_DIST_PAIR})*")
+
+
+@lru_cache(maxsize=None)
+def check_distribution(dist_str: str, valid_keys: frozenset):
+    """Raise ValueError if dist_str is not a valid distribution; valid strings are remembered."""
+    # Values are unsigned in the pattern, so negative values fail the format check
+    if not _DIST_FULL_RE.fullmatch(dist_str):
+        raise ValueError(f"Invalid distribution format '{dist_str}': expected non-negative 'key:value,key:value'")
+    
+    for key, _ in _DIST_RE.findall(dist_str):
+        if key not in valid_keys:
+            raise ValueError(f"Invalid key '{key}' in distribution '{dist_str}'")
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to a per-instance __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SynthRadConfig:
-    """Individual SynthRad configuration with validation."""
+    """Individual SynthRad configuration with validation.
+    
+    Configurations are immutable, so the synthrad arguments are built once and cached.
+    """
     
     # Required fields
     name: str
@@ -28,15 +87,15 @@ class SynthRadConfig:
     
     # Tumor and staging
     lobe: Optional[str] = None
-    stage_distribution: str = "I:0.25,II:0.25,III:0.30,IV:0.20"
+    stage_distribution: str = _DEFAULT_STAGE_DIST
     
     # Follow-up settings
     follow_up: bool = False
-    follow_up_days: int = 90
-    studies_per_patient: int = 5
+    follow_up_days: int = _DEFAULT_FOLLOW_UP_DAYS
+    studies_per_patient: int = _DEFAULT_STUDIES_PER_PATIENT
     
     # Response tracking
-    response_distribution: str = "CR:0.1,PR:0.3,SD:0.4,PD:0.2"
+    response_distribution: str = _DEFAULT_RESPONSE_DIST
     
     # RadLex anatomic mapping
     use_radlex: bool = True
@@ -49,9 +108,18 @@ class SynthRadConfig:
     description: str = ""
     tags: List[str] = field(default_factory=list)
     
+    # Set by the built-in sample/research tables, whose distributions are known to be valid
+    _trusted: bool = field(default=False, repr=False, compare=False)
+    
+    # Derived state, declared as fields so they get slots; not part of the configuration
+    _tag_set: frozenset = field(default=frozenset(), init=False, repr=False, compare=False)
+    _synthrad_args: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate configuration after initialization."""
         self._validate()
+        # Tag set for filter_by_tags; set through object since the dataclass is frozen
+        object.__setattr__(self, "_tag_set", frozenset(self.tags))
     
     def _validate(self):
         """Validate configuration parameters."""
@@ -78,101 +146,123 @@ class SynthRadConfig:
             raise ValueError(f"lobe must be one of {valid_lobes}")
         
         # Validate distributions
-        self._validate_distribution(self.stage_distribution, ["I", "II", "III", "IV"])
-        self._validate_distribution(self.response_distribution, ["CR", "PR", "SD", "PD"])
+        if not self._trusted:
+            self._validate_distribution(self.stage_distribution, _STAGE_KEYS)
+            self._validate_distribution(self.response_distribution, _RESPONSE_KEYS)
     
-    def _validate_distribution(self, dist_str: str, valid_keys: List[str]):
+    def _validate_distribution(self, dist_str: str, valid_keys: frozenset):
         """Validate distribution string format."""
-        if not dist_str:
-            return
-        
-        try:
-            parts = dist_str.split(",")
-            for part in parts:
-                key, value = part.split(":")
-                key = key.strip()
-                value = float(value.strip())
-                
-                if key not in valid_keys:
-                    raise ValueError(f"Invalid key '{key}' in distribution '{dist_str}'")
-                
-                if value < 0:
-                    raise ValueError(f"Distribution values must be non-negative: {dist_str}")
-                    
-        except (ValueError, AttributeError) as e:
-            raise ValueError(f"Invalid distribution format '{dist_str}': {e}")
+        if dist_str:
+            check_distribution(dist_str, valid_keys)
     
     def to_synthrad_args(self) -> List[str]:
         """Convert configuration to SynthRad command-line arguments."""
-        args = []
-        
+        return list(self.synthrad_args)
+    
+    @property
+    def synthrad_args(self) -> Tuple[str, ...]:
+        """SynthRad command-line arguments, built on first access."""
+        if self._synthrad_args is None:
+            object.__setattr__(self, "_synthrad_args", self._build_synthrad_args())
+        return self._synthrad_args
+    
+    def _build_synthrad_args(self) -> Tuple[str, ...]:
         # Required parameters
-        args.extend(["--n", str(self.num_patients)])
-        args.extend(["--out", self.output_dir])
-        args.extend(["--seed", str(self.seed)])
+        args = ["--n", str(self.num_patients), "--out", self.output_dir, "--seed", str(self.seed)]
         
         # Optional parameters
         if self.lobe:
-            args.extend(["--lobe", self.lobe])
+            args += ("--lobe", self.lobe)
         
-        if self.stage_distribution != "I:0.25,II:0.25,III:0.30,IV:0.20":
-            args.extend(["--stage-dist", self.stage_distribution])
+        if self.stage_distribution != _DEFAULT_STAGE_DIST:
+            args += ("--stage-dist", self.stage_distribution)
         
         if self.follow_up:
             args.append("--follow-up")
         
-        if self.follow_up_days != 90:
-            args.extend(["--follow-up-days", str(self.follow_up_days)])
+        if self.follow_up_days != _DEFAULT_FOLLOW_UP_DAYS:
+            args += ("--follow-up-days", str(self.follow_up_days))
         
-        if self.studies_per_patient != 5:
-            args.extend(["--studies-per-patient", str(self.studies_per_patient)])
+        if self.studies_per_patient != _DEFAULT_STUDIES_PER_PATIENT:
+            args += ("--studies-per-patient", str(self.studies_per_patient))
         
-        if self.response_distribution != "CR:0.1,PR:0.3,SD:0.4,PD:0.2":
-            args.extend(["--response-dist", self.response_distribution])
+        if self.response_distribution != _DEFAULT_RESPONSE_DIST:
+            args += ("--response-dist", self.response_distribution)
         
         if not self.use_radlex:
-            args.extend(["--no-radlex"])
+            args.append("--no-radlex")
         
         if self.legacy_mode:
             args.append("--legacy-mode")
         
         if self.jsonl_filename:
-            args.extend(["--jsonl", self.jsonl_filename])
+            args += ("--jsonl", self.jsonl_filename)
         
-        return args
+        return tuple(args)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "name": self.name,
+            "output_dir": self.output_dir,
+            "num_patients": self.num_patients,
+            "seed": self.seed,
+            "lobe": self.lobe,
+            "stage_distribution": self.stage_distribution,
+            "follow_up": self.follow_up,
+            "follow_up_days": self.follow_up_days,
+            "studies_per_patient": self.studies_per_patient,
+            "response_distribution": self.response_distribution,
+            "use_radlex": self.use_radlex,
+            "legacy_mode": self.legacy_mode,
+            "jsonl_filename": self.jsonl_filename,
+            "description": self.description,
+            "tags": list(self.tags)
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConfigSet:
-    """A set of SynthRad configurations with metadata."""
+    """A set of SynthRad configurations with metadata.
+    
+    Change configs through add_config or by assigning a new list; editing the list in
+    place (item assignment, append, remove) is not seen by get_config_by_name.
+    """
     
     name: str
     description: str = ""
     configs: List[SynthRadConfig] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # Name lookup built on first use; dropped by add_config and by assigning configs
+    _name_index: Optional[Dict[str, SynthRadConfig]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any):
+        # object.__setattr__ rather than super(): slots=True rebuilds the class, which breaks bare super()
+        object.__setattr__(self, name, value)
+        if name == "configs":
+            object.__setattr__(self, "_name_index", None)
+    
     def add_config(self, config: SynthRadConfig):
         """Add a configuration to the set."""
         self.configs.append(config)
+        self._name_index = None
     
     def get_config_by_name(self, name: str) -> Optional[SynthRadConfig]:
         """Get configuration by name."""
-        for config in self.configs:
-            if config.name == name:
-                return config
-        return None
+        if self._name_index is None:
+            # reversed so the first configuration with a given name wins, as with a linear scan
+            self._name_index = {config.name: config for config in reversed(self.configs)}
+        return self._name_index.get(name)
     
     def filter_by_tags(self, tags: List[str]) -> List[SynthRadConfig]:
         """Filter configurations by tags."""
         if not tags:
             return self.configs
         
+        query = frozenset(tags)
         return [config for config in self.configs 
-                if any(tag in config.tags for tag in tags)]
+                if not config._tag_set.isdisjoint(query)]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -184,9 +274,92 @@ class ConfigSet:
         }
 
 
+# Rows for ConfigManager.create_sample_configs / create_research_configs:
+# (name, description, num_patients, settings other than the defaults, tags)
+_SAMPLE_CONFIGS = [
+    # Baseline configurations
+    ("baseline_standard", "Standard baseline generation", 5, {}, ["baseline", "standard"]),
+    ("baseline_early_stage", "Early stage focused baseline", 10,
+     {"stage_distribution": "I:0.6,II:0.3,III:0.1,IV:0.0"}, ["baseline", "early-stage"]),
+    ("baseline_advanced_stage", "Advanced stage focused baseline", 10,
+     {"stage_distribution": "I:0.0,II:0.1,III:0.4,IV:0.5"}, ["baseline", "advanced-stage"]),
+    
+    # Follow-up configurations
+    ("followup_standard", "Standard follow-up generation", 5,
+     {"follow_up": True, "studies_per_patient": 4}, ["followup", "standard"]),
+    ("followup_optimistic", "Optimistic response follow-up", 5,
+     {"follow_up": True, "studies_per_patient": 4, "response_distribution": "CR:0.2,PR:0.4,SD:0.3,PD:0.1"},
+     ["followup", "optimistic"]),
+    ("followup_conservative", "Conservative response follow-up", 5,
+     {"follow_up": True, "studies_per_patient": 4, "response_distribution": "CR:0.05,PR:0.2,SD:0.5,PD:0.25"},
+     ["followup", "conservative"]),
+    
+    # RadLex configurations
+    ("radlex_disabled", "Without RadLex anatomic mapping", 5, {"use_radlex": False}, ["radlex", "disabled"]),
+    ("radlex_standard", "With RadLex anatomic mapping", 5, {}, ["radlex", "standard"]),
+    
+    # Special configurations
+    ("jsonl_output", "Generate with JSONL output for React app", 5,
+     {"studies_per_patient": 4, "jsonl_filename": "cohort_labels.jsonl"}, ["jsonl", "react"]),
+    ("custom_interval", "Generate with custom follow-up interval", 5,
+     {"follow_up": True, "follow_up_days": 60, "studies_per_patient": 4}, ["followup", "custom-interval"]),
+    ("legacy_mode", "Generate using legacy mode", 5, {"legacy_mode": True, "follow_up": True}, ["legacy"]),
+]
+
+_RESEARCH_CONFIGS = [
+    # Clinical trial arms
+    ("clinical_trial_arm_a", "Clinical trial arm A - standard treatment", 50,
+     {"follow_up": True, "studies_per_patient": 6, "response_distribution": "CR:0.15,PR:0.35,SD:0.35,PD:0.15",
+      "jsonl_filename": "arm_a_cohort.jsonl"},
+     ["clinical-trial", "arm-a", "standard-treatment"]),
+    ("clinical_trial_arm_b", "Clinical trial arm B - experimental treatment", 50,
+     {"follow_up": True, "studies_per_patient": 6, "response_distribution": "CR:0.25,PR:0.4,SD:0.25,PD:0.1",
+      "jsonl_filename": "arm_b_cohort.jsonl"},
+     ["clinical-trial", "arm-b", "experimental-treatment"]),
+] + [
+    # Follow-up interval studies
+    (f"followup_{days}_days", f"{days}-day follow-up interval", 20,
+     {"follow_up": True, "follow_up_days": days, "studies_per_patient": 4},
+     ["followup", "interval-study", f"{days}-days"])
+    for days in (30, 60, 90)
+] + [
+    # Lobe-specific studies
+    (f"{lobe.lower()}_lobe", f"{lobe} lobe cases only", 30,
+     {"lobe": lobe, "follow_up": True, "studies_per_patient": 3}, ["lobe-study", tag])
+    for lobe, tag in [("RUL", "right-upper"), ("LLL", "left-lower")]
+]
+
+
+# SynthRadConfig field defaults, for reading raw configuration dicts
+_CONFIG_DEFAULTS = {f.name: f.default for f in fields(SynthRadConfig) if f.default is not MISSING}
+
+
+def _user_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return config fields from user data, rejecting private ones such as _trusted."""
+    private = [key for key in data if key.startswith("_")]
+    if private:
+        raise ValueError(f"Unknown configuration keys: {', '.join(private)}")
+    return data
+
+
 class ConfigManager:
     """Manager for loading, saving, and creating configuration sets."""
     
+    @staticmethod
+    def _add_configs(config_set: ConfigSet, output_root: str, rows: List[Tuple]) -> ConfigSet:
+        """Add one configuration per (name, description, num_patients, settings, tags) row."""
+        for name, description, num_patients, settings, tags in rows:
+            config_set.add_config(SynthRadConfig(
+                name=name,
+                description=description,
+                output_dir=f"{output_root}/{name}",
+                num_patients=num_patients,
+                tags=list(tags),
+                _trusted=True,
+                **settings
+            ))
+        return config_set
+    
     @staticmethod
     def create_sample_configs() -> ConfigSet:
         """Create a sample configuration set."""
@@ -194,137 +367,7 @@ class ConfigManager:
             name="Sample Configurations",
             description="Example configurations demonstrating different SynthRad features"
         )
-        
-        # Baseline configurations
-        config_set.add_config(SynthRadConfig(
-            name="baseline_standard",
-            description="Standard baseline generation",
-            output_dir="./out/baseline_standard",
-            num_patients=5,
-            tags=["baseline", "standard"]
-        ))
-        
-        config_set.add_config(SynthRadConfig(
-            name="baseline_early_stage",
-            description="Early stage focused baseline",
-            output_dir="./out/baseline_early_stage",
-            num_patients=10,
-            stage_distribution="I:0.6,II:0.3,III:0.1,IV:0.0",
-            tags=["baseline", "early-stage"]
-        ))
-        
-        config_set.add_config(SynthRadConfig(
-            name="baseline_advanced_stage",
-            description="Advanced stage focused baseline",
-            output_dir="./out/baseline_advanced_stage",
-            num_patients=10,
-            stage_distribution="I:0.0,II:0.1,III:0.4,IV:0.5",
-            tags=["baseline", "advanced-stage"]
-        ))
-        
-        # Follow-up configurations
-        config_set.add_config(SynthRadConfig(
-            name="followup_standard",
-            description="Standard follow-up generation",
-            output_dir="./out/followup_standard",
-            num_patients=5,
-            follow_up=True,
-            studies_per_patient=4,
-            tags=["followup", "standard"]
-        ))
-        
-        config_set.add_config(SynthRadConfig(
-            name="followup_optimistic",
-            description="Optimistic response follow-up",
-            output_dir="./out/followup_optimistic",
-            num_patients=5,
-            follow_up=True,
-            studies_per_patient=4,
-            response_distribution="CR:0.2,PR:0.4,SD:0.3,PD:0.1",
-            tags=["followup", "optimistic"]
-        ))
-        
-        config_set.add_config(SynthRadConfig(
-            name="followup_conservative",
-            description="Conservative response follow-up",
-            output_dir="./out/followup_conservative",
-            num_patients=5,
-            follow_up=True,
-            studies_per_patient=4,
-            response_distribution="CR:0.05,PR:0.2,SD:0.5,PD:0.25",
-            tags=["followup", "conservative"]
-        ))
-        
-        # RadLex configurations
-        config_set.add_config(SynthRadConfig(
-            name="radlex_minimal",
-            description="Minimal RadLex enhancement",
-            output_dir="./out/radlex_minimal",
-            num_patients=5,
-            radlex_distribution="minimal:1.0",
-            tags=["radlex", "minimal"]
-        ))
-        
-        config_set.add_config(SynthRadConfig(
-            name="radlex_standard",
-            description="Standard RadLex enhancement",
-            output_dir="./out/radlex_standard",
-            num_patients=5,
-            radlex_distribution="standard:1.0",
-            tags=["radlex", "standard"]
-        ))
-        
-        config_set.add_config(SynthRadConfig(
-            name="radlex_aggressive",
-            description="Aggressive RadLex enhancement",
-            output_dir="./out/radlex_aggressive",
-            num_patients=5,
-            radlex_distribution="aggressive:1.0",
-            tags=["radlex", "aggressive"]
-        ))
-        
-        config_set.add_config(SynthRadConfig(
-            name="radlex_mixed",
-            description="Mixed RadLex enhancement",
-            output_dir="./out/radlex_mixed",
-            num_patients=5,
-            radlex_distribution="minimal:0.2,standard:0.5,aggressive:0.2,conservative:0.1",
-            tags=["radlex", "mixed"]
-        ))
-        
-        # Special configurations
-        config_set.add_config(SynthRadConfig(
-            name="jsonl_output",
-            description="Generate with JSONL output for React app",
-            output_dir="./out/jsonl_output",
-            num_patients=5,
-            studies_per_patient=4,
-            jsonl_filename="cohort_labels.jsonl",
-            tags=["jsonl", "react"]
-        ))
-        
-        config_set.add_config(SynthRadConfig(
-            name="custom_interval",
-            description="Generate with custom follow-up interval",
-            output_dir="./out/custom_interval",
-            num_patients=5,
-            follow_up=True,
-            follow_up_days=60,
-            studies_per_patient=4,
-            tags=["followup", "custom-interval"]
-        ))
-        
-        config_set.add_config(SynthRadConfig(
-            name="legacy_mode",
-            description="Generate using legacy mode",
-            output_dir="./out/legacy_mode",
-            num_patients=5,
-            legacy_mode=True,
-            follow_up=True,
-            tags=["legacy"]
-        ))
-        
-        return config_set
+        return ConfigManager._add_configs(config_set, "./out", _SAMPLE_CONFIGS)
     
     @staticmethod
     def create_research_configs() -> ConfigSet:
@@ -334,84 +377,22 @@ class ConfigManager:
             description="Configurations for research and clinical trial simulation",
             metadata={"type": "research", "version": "1.0"}
         )
-        
-        # Clinical trial arms
-        config_set.add_config(SynthRadConfig(
-            name="clinical_trial_arm_a",
-            description="Clinical trial arm A - standard treatment",
-            output_dir="./research/clinical_trial_arm_a",
-            num_patients=50,
-            follow_up=True,
-            studies_per_patient=6,
-            response_distribution="CR:0.15,PR:0.35,SD:0.35,PD:0.15",
-            jsonl_filename="arm_a_cohort.jsonl",
-            tags=["clinical-trial", "arm-a", "standard-treatment"]
-        ))
-        
-        config_set.add_config(SynthRadConfig(
-            name="clinical_trial_arm_b",
-            description="Clinical trial arm B - experimental treatment",
-            output_dir="./research/clinical_trial_arm_b",
-            num_patients=50,
-            follow_up=True,
-            studies_per_patient=6,
-            response_distribution="CR:0.25,PR:0.4,SD:0.25,PD:0.1",
-            jsonl_filename="arm_b_cohort.jsonl",
-            tags=["clinical-trial", "arm-b", "experimental-treatment"]
-        ))
-        
-        # Follow-up interval studies
-        for days, tag in [(30, "30-days"), (60, "60-days"), (90, "90-days")]:
-            config_set.add_config(SynthRadConfig(
-                name=f"followup_{days}_days",
-                description=f"{days}-day follow-up interval",
-                output_dir=f"./research/followup_{days}_days",
-                num_patients=20,
-                follow_up=True,
-                follow_up_days=days,
-                studies_per_patient=4,
-                tags=["followup", "interval-study", tag]
-            ))
-        
-        # Lobe-specific studies
-        for lobe, tag in [("RUL", "right-upper"), ("LLL", "left-lower")]:
-            config_set.add_config(SynthRadConfig(
-                name=f"{lobe.lower()}_lobe",
-                description=f"{lobe} lobe cases only",
-                output_dir=f"./research/{lobe.lower()}_lobe",
-                num_patients=30,
-                lobe=lobe,
-                follow_up=True,
-                studies_per_patient=3,
-                tags=["lobe-study", tag]
-            ))
-        
-        return config_set
+        return ConfigManager._add_configs(config_set, "./research", _RESEARCH_CONFIGS)
     
     @staticmethod
     def load_from_json(file_path: str) -> ConfigSet:
         """Load configuration set from JSON file."""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        config_set = ConfigSet(
-            name=data.get("name", "Unnamed Config Set"),
-            description=data.get("description", ""),
-            metadata=data.get("metadata", {})
-        )
-        
-        for config_data in data.get("configurations", []):
-            config = SynthRadConfig(**config_data)
-            config_set.add_config(config)
-        
-        return config_set
+        return ConfigManager._config_set_from_dict(_json_loads(Path(file_path).read_bytes()))
     
     @staticmethod
     def load_from_yaml(file_path: str) -> ConfigSet:
         """Load configuration set from YAML file."""
-        with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
-        
+        # The YAML loaders accept bytes and detect the encoding themselves
+        return ConfigManager._config_set_from_dict(yaml.load(Path(file_path).read_bytes(), Loader=_YamlLoader))
+    
+    @staticmethod
+    def _config_set_from_dict(data: Dict[str, Any]) -> ConfigSet:
+        """Build a configuration set from parsed JSON/YAML data."""
         config_set = ConfigSet(
             name=data.get("name", "Unnamed Config Set"),
             description=data.get("description", ""),
@@ -419,22 +400,56 @@ class ConfigManager:
         )
         
         for config_data in data.get("configurations", []):
-            config = SynthRadConfig(**config_data)
+            config = SynthRadConfig(**_user_fields(config_data))
             config_set.add_config(config)
         
         return config_set
     
+    @staticmethod
+    def summarize(file_path: str):
+        """Print a summary of a configuration file from the parsed data, without building or validating configs."""
+        path = Path(file_path)
+        raw = path.read_bytes()
+        if path.suffix.lower() in ('.yaml', '.yml'):
+            data = yaml.load(raw, Loader=_YamlLoader)
+        else:
+            data = _json_loads(raw)
+        
+        ConfigManager.print_summary(data)
+    
+    @staticmethod
+    def print_summary(data: Dict[str, Any]):
+        """Print a configuration set summary from its dict form (as in the files or ConfigSet.to_dict)."""
+        print(f"\nConfiguration Set: {data.get('name', 'Unnamed Config Set')}")
+        if data.get("description"):
+            print(f"Description: {data['description']}")
+        
+        if data.get("metadata"):
+            print(f"Metadata: {data['metadata']}")
+        
+        configs = data.get("configurations", [])
+        print(f"\nConfigurations ({len(configs)}):")
+        for i, config in enumerate(configs, 1):
+            print(f"  {i}. {config.get('name')}")
+            if config.get("description"):
+                print(f"     {config['description']}")
+            print(f"     Output: {config.get('output_dir')}")
+            print(f"     Patients: {config.get('num_patients', _CONFIG_DEFAULTS['num_patients'])}")
+            if config.get("tags"):
+                print(f"     Tags: {', '.join(config['tags'])}")
+            print()
+    
     @staticmethod
     def save_to_json(config_set: ConfigSet, file_path: str):
         """Save configuration set to JSON file."""
-        with open(file_path, 'w') as f:
-            json.dump(config_set.to_dict(), f, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(_json_dumps(config_set.to_dict()))
     
     @staticmethod
     def save_to_yaml(config_set: ConfigSet, file_path: str):
         """Save configuration set to YAML file."""
         with open(file_path, 'w') as f:
-            yaml.dump(config_set.to_dict(), f, default_flow_style=False, indent=2)
+            yaml.dump(config_set.to_dict(), f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
 
 
 def create_config_from_dict(data: Dict[str, Any]) -> SynthRadConfig:
@@ -463,4 +478,4 @@ def create_config_from_dict(data: Dict[str, Any]) -> SynthRadConfig:
         if key not in key_mapping:
             mapped_data[key] = value
     
-    return SynthRadConfig(**mapped_data)
+    return SynthRadConfig(**_user_fields(mapped_data))